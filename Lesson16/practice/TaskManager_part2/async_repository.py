@@ -0,0 +1,111 @@
+"""
+Асинхронный фасад над TaskRepository для использования из asyncio.
+
+Запросы к SQLite выполняются в потоках, чтобы не блокировать цикл событий:
+все изменения идут через один поток-писатель (SQLite все равно допускает
+только одного писателя), чтения распределяются по пулу потоков-читателей.
+Соединения открываются с профилем "balanced" (WAL), поэтому читатели
+не ждут писателя.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Optional
+import asyncio
+import functools
+
+from connection import ConnectionPool
+from solution import Task, TaskRepository
+
+
+class AsyncTaskRepository:
+    """Корутинные версии методов TaskRepository."""
+
+    def __init__(self, db_file: Optional[Path] = None, readers: int = 4):
+        """
+        Args:
+            db_file: Файл базы данных (по умолчанию TaskRepository.DB_FILE).
+            readers: Количество потоков (и соединений) для чтения.
+        """
+        db_file = Path(db_file) if db_file is not None else TaskRepository.DB_FILE
+        # Писатель создается первым: его соединение переводит файл в режим WAL
+        self._writer_pool = ConnectionPool(db_file, size=1, profile="balanced")
+        self._writer = TaskRepository(pool=self._writer_pool)
+        self._reader_pool = ConnectionPool(db_file, size=readers, profile="balanced")
+        self._reader = TaskRepository(pool=self._reader_pool)
+        self._write_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tasks-writer")
+        self._read_executor = ThreadPoolExecutor(max_workers=readers, thread_name_prefix="tasks-reader")
+
+    async def _write(self, method, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._write_executor, functools.partial(method, *args, **kwargs))
+
+    async def _read(self, method, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._read_executor, functools.partial(method, *args, **kwargs))
+
+    # Запись
+    async def save(self, task: Task) -> None:
+        await self._write(self._writer.save, task)
+
+    async def save_many(self, tasks: Iterable[Task], chunk_size: int = 1000) -> int:
+        return await self._write(self._writer.save_many, list(tasks), chunk_size)
+
+    async def delete(self, task: Task) -> None:
+        await self._write(self._writer.delete, task)
+
+    async def delete_completed_tasks(self) -> int:
+        return await self._write(self._writer.delete_completed_tasks)
+
+    async def delete_all_tasks(self) -> int:
+        return await self._write(self._writer.delete_all_tasks)
+
+    # Чтение
+    async def get_by_id(self, id) -> Optional[Task]:
+        return await self._read(self._reader.get_by_id, id)
+
+    async def get_all_tasks(self) -> list[Task]:
+        return await self._read(self._reader.get_all_tasks)
+
+    async def get_tasks_by_status(self, status: TaskRepository.StatusType) -> list[Task]:
+        return await self._read(self._reader.get_tasks_by_status, status)
+
+    async def get_tasks_by_priority(self, priority: TaskRepository.PriorityType) -> list[Task]:
+        return await self._read(self._reader.get_tasks_by_priority, priority)
+
+    async def get_completed_tasks(self) -> list[Task]:
+        return await self._read(self._reader.get_completed_tasks)
+
+    async def get_tasks_by_title_contains(self, keyword: str, full_text: bool = False) -> list[Task]:
+        return await self._read(self._reader.get_tasks_by_title_contains, keyword, full_text)
+
+    async def search(self, text: str, prefix: bool = True, limit: Optional[int] = None) -> list[Task]:
+        return await self._read(self._reader.search, text, prefix, limit)
+
+    async def get_tasks_by_priority_range(self, min_priority: TaskRepository.PriorityType,
+                                          max_priority: TaskRepository.PriorityType,
+                                          order: TaskRepository.Order_byType = 'ASC') -> list[Task]:
+        return await self._read(self._reader.get_tasks_by_priority_range, min_priority, max_priority, order)
+
+    async def get_all_tasks_sorted_by_priority(self, order: TaskRepository.Order_byType = 'ASC') -> list[Task]:
+        return await self._read(self._reader.get_all_tasks_sorted_by_priority, order)
+
+    async def get_tasks_by_status_sorted_by_priority(self, status: TaskRepository.StatusType,
+                                                     order: TaskRepository.Order_byType = 'ASC') -> list[Task]:
+        return await self._read(self._reader.get_tasks_by_status_sorted_by_priority, status, order)
+
+    async def close(self) -> None:
+        """Дожидается выполнения поставленных запросов и закрывает соединения."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._shutdown)
+
+    def _shutdown(self) -> None:
+        self._write_executor.shutdown(wait=True)
+        self._read_executor.shutdown(wait=True)
+        self._writer_pool.close()
+        self._reader_pool.close()
+
+    async def __aenter__(self) -> "AsyncTaskRepository":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
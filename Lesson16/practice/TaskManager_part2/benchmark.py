@@ -0,0 +1,152 @@
+"""
+Замеры производительности TaskRepository.
+
+Запуск: python benchmark.py
+"""
+import sqlite3
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from connection import PROFILES
+from solution import Task, TaskRepository, task_row_factory
+
+
+class DictTask:
+    """Задача в прежнем виде (обычный класс с __dict__) - для сравнения с Task."""
+
+    def __init__(self, title, description="", status="Pending", priority=3, id=None):
+        self.id = id
+        self.title = title
+        self.description = description
+        self.status = status
+        self.priority = priority
+
+
+def make_tasks(count: int) -> list[Task]:
+    """Создает count задач со статусами и приоритетами по кругу."""
+    statuses = (Task.PENDING, Task.IN_PROGRESS, Task.COMPLETED)
+    return [
+        Task(f"задача {i}", f"описание {i}", status=statuses[i % 3], priority=i % 5 + 1)
+        for i in range(count)
+    ]
+
+
+def bench_save_many(count: int = 2000, chunk_size: int = 1000) -> dict:
+    """Сравнивает сохранение задач циклом save() и одним вызовом save_many()."""
+    with tempfile.TemporaryDirectory() as tmp:
+        repository = TaskRepository(db_file=Path(tmp) / "loop.db")
+        tasks = make_tasks(count)
+        start = time.perf_counter()
+        for task in tasks:
+            repository.save(task)
+        loop_time = time.perf_counter() - start
+
+        repository = TaskRepository(db_file=Path(tmp) / "bulk.db")
+        tasks = make_tasks(count)
+        start = time.perf_counter()
+        repository.save_many(tasks, chunk_size=chunk_size)
+        bulk_time = time.perf_counter() - start
+
+    return {
+        "count": count,
+        "loop_tasks_per_sec": count / loop_time,
+        "save_many_tasks_per_sec": count / bulk_time,
+        "speedup": loop_time / bulk_time,
+    }
+
+
+def _measure(build) -> tuple[float, int]:
+    """Возвращает время построения результата build() и пик выделенной памяти (отдельным прогоном)."""
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    del result
+    tracemalloc.start()
+    result = build()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return elapsed, peak
+
+
+def bench_row_mapping(count: int = 1_000_000) -> dict:
+    """
+    Сравнивает чтение count строк tasks в прежние объекты (кортеж -> DictTask(*data[1:], data[0]))
+    и в Task со __slots__ через task_row_factory: время и пик памяти.
+    """
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE tasks (task_id INTEGER PRIMARY KEY, title TEXT, description TEXT, "
+                 "status TEXT, priority INTEGER)")
+    conn.executemany("INSERT INTO tasks (title, description, status, priority) VALUES (?, ?, ?, ?)",
+                     ((t.title, t.description, t.status, t.priority) for t in make_tasks(count)))
+
+    def legacy():
+        cursor = conn.execute("SELECT * FROM tasks")
+        return [DictTask(*data[1:], data[0]) for data in cursor.fetchall()]
+
+    def slots():
+        cursor = conn.cursor()
+        cursor.row_factory = task_row_factory
+        return cursor.execute("SELECT * FROM tasks").fetchall()
+
+    legacy_time, legacy_peak = _measure(legacy)
+    slots_time, slots_peak = _measure(slots)
+    conn.close()
+    return {
+        "count": count,
+        "legacy_sec": legacy_time,
+        "slots_sec": slots_time,
+        "legacy_bytes_per_task": legacy_peak / count,
+        "slots_bytes_per_task": slots_peak / count,
+    }
+
+
+def bench_profiles(writes: int = 500, reads: int = 200) -> dict:
+    """
+    Для каждого профиля из PROFILES: скорость записи отдельными транзакциями (save),
+    пакетной записи (save_many) и чтения по статусу.
+    """
+    results = {}
+    for profile in PROFILES:
+        with tempfile.TemporaryDirectory() as tmp:
+            repository = TaskRepository(db_file=Path(tmp) / "tasks.db", profile=profile)
+            tasks = make_tasks(writes)
+            start = time.perf_counter()
+            for task in tasks:
+                repository.save(task)
+            single_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            repository.save_many(make_tasks(writes * 20))
+            bulk_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for _ in range(reads):
+                repository.get_tasks_by_status(Task.PENDING)
+            read_time = time.perf_counter() - start
+
+        results[profile] = {
+            "single_writes_per_sec": writes / single_time,
+            "bulk_writes_per_sec": writes * 20 / bulk_time,
+            "reads_per_sec": reads / read_time,
+        }
+    return results
+
+
+if __name__ == "__main__":
+    result = bench_save_many()
+    print(f"save() в цикле:  {result['loop_tasks_per_sec']:>12.0f} задач/с")
+    print(f"save_many():     {result['save_many_tasks_per_sec']:>12.0f} задач/с")
+    print(f"ускорение:       {result['speedup']:>12.1f}x")
+
+    result = bench_row_mapping()
+    print(f"чтение {result['count']} строк:")
+    print(f"  DictTask: {result['legacy_sec']:.2f} с, {result['legacy_bytes_per_task']:.0f} байт/задачу")
+    print(f"  Task:     {result['slots_sec']:.2f} с, {result['slots_bytes_per_task']:.0f} байт/задачу")
+
+    print("профили (save/с, save_many/с, чтений/с):")
+    for profile, result in bench_profiles().items():
+        print(f"  {profile:<10} {result['single_writes_per_sec']:>8.0f} "
+              f"{result['bulk_writes_per_sec']:>10.0f} {result['reads_per_sec']:>8.0f}")
@@ -0,0 +1,89 @@
+"""
+Ограниченный по размеру LRU-кэш с временем жизни записей.
+Используется TaskRepository для get_by_id.
+"""
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+import threading
+import time
+
+
+class LRUCache:
+    """
+    LRU-кэш на OrderedDict: при переполнении вытесняется запись,
+    к которой дольше всех не обращались. Записи старше ttl секунд
+    считаются отсутствующими. Потокобезопасен.
+
+    generation увеличивается при каждой инвалидации. Читатель запоминает его
+    до запроса к базе и передает в put: если за время запроса данные
+    инвалидировали, устаревшее значение в кэш не попадет.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        """
+        Args:
+            maxsize: Максимальное количество записей.
+            ttl: Время жизни записи в секундах (None - бессрочно).
+        """
+        if maxsize < 1:
+            raise ValueError("Размер кэша должен быть не меньше 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.generation = 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Возвращает значение по ключу или None, если его нет или оно устарело."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, value: Any, generation: Optional[int] = None) -> None:
+        """Сохраняет значение. Если передан generation и он устарел - ничего не делает."""
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, *keys: Hashable) -> None:
+        """Удаляет записи по ключам."""
+        with self._lock:
+            self.generation += 1
+            for key in keys:
+                self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Удаляет все записи (счетчики попаданий сохраняются)."""
+        with self._lock:
+            self.generation += 1
+            self._data.clear()
+
+    def stats(self) -> dict:
+        """Счетчики для подбора размера кэша."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / total if total else 0.0,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+            }
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -1,5 +1,293 @@
+from collections import Counter, OrderedDict
 from pathlib import Path
+from typing import Optional
+import queue
 import sqlite3
+import threading
+
+
+# Профили настроек SQLite. Применяются к каждому новому соединению.
+# durable   - максимальная сохранность: WAL + полная синхронизация на каждый commit;
+# balanced  - WAL + synchronous=NORMAL (после сбоя питания может потеряться
+#             последняя транзакция, но база не повреждается), больший кэш и mmap;
+# bulk-load - массовая загрузка: журнал в памяти и без синхронизации,
+#             при сбое во время загрузки база может быть повреждена.
+PROFILES = {
+    "durable": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "cache_size": -2000,  # отрицательное значение - размер в КиБ
+        "mmap_size": 0,
+        "temp_store": "DEFAULT",
+    },
+    "balanced": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -16000,
+        "mmap_size": 128 * 1024 * 1024,
+        "temp_store": "MEMORY",
+    },
+    "bulk-load": {
+        "journal_mode": "MEMORY",
+        "synchronous": "OFF",
+        "cache_size": -64000,
+        "mmap_size": 256 * 1024 * 1024,
+        "temp_store": "MEMORY",
+    },
+}
+
+
+def apply_profile(conn: sqlite3.Connection, profile: str) -> None:
+    """Выполняет PRAGMA профиля profile на соединении conn."""
+    if profile not in PROFILES:
+        raise ValueError(f"Неизвестный профиль '{profile}', допустимые: {', '.join(PROFILES)}")
+    for pragma, value in PROFILES[profile].items():
+        conn.execute(f"PRAGMA {pragma} = {value}")
+
+
+# Размер кэша подготовленных выражений на соединение (как у sqlite3.connect по умолчанию)
+DEFAULT_CACHED_STATEMENTS = 128
+
+class StatementStats:
+    """
+    Счетчики использования подготовленных выражений по тексту SQL.
+    Промах - выражение разбирается заново (его нет в кэше соединения),
+    попадание - sqlite3 берет уже подготовленное выражение из кэша.
+    """
+
+    def __init__(self):
+        self.hits: Counter = Counter()
+        self.misses: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, sql: str, hit: bool) -> None:
+        with self._lock:
+            (self.hits if hit else self.misses)[sql] += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self.hits.clear()
+            self.misses.clear()
+
+    def summary(self, registry: Optional["StatementRegistry"] = None) -> dict:
+        """
+        Счетчики {имя или SQL: {"hits": ..., "misses": ...}}.
+        Если передан registry - только его именованные выражения.
+        """
+        with self._lock:
+            if registry is not None:
+                return {name: {"hits": self.hits[sql], "misses": self.misses[sql]}
+                        for name, sql in registry.items()}
+            return {sql: {"hits": self.hits[sql], "misses": self.misses[sql]}
+                    for sql in self.hits.keys() | self.misses.keys()}
+
+
+STATEMENT_STATS = StatementStats()
+
+
+class StatementRegistry:
+    """Реестр именованных SQL-выражений приложения: один текст на запрос - одна запись в кэше."""
+
+    def __init__(self, statements: dict[str, str]):
+        self._statements = dict(statements)
+
+    def __getitem__(self, name: str) -> str:
+        return self._statements[name]
+
+    def items(self):
+        return self._statements.items()
+
+    def stats(self) -> dict:
+        """Попадания/промахи кэша выражений для каждого имени."""
+        return STATEMENT_STATS.summary(self)
+
+
+class TrackedCursor(sqlite3.Cursor):
+    """Курсор, сообщающий соединению о каждом выполняемом выражении."""
+
+    def execute(self, sql, parameters=()):
+        self.connection._track_statement(sql)
+        return super().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        self.connection._track_statement(sql)
+        return super().executemany(sql, seq_of_parameters)
+
+
+class TrackedConnection(sqlite3.Connection):
+    """
+    Соединение, которое ведет копию LRU-кэша выражений sqlite3
+    (тот же размер cached_statements, тот же ключ - текст SQL)
+    и по ней считает попадания и промахи в STATEMENT_STATS.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cached_statements = kwargs.get("cached_statements", DEFAULT_CACHED_STATEMENTS)
+        self._statements: OrderedDict = OrderedDict()
+
+    def _track_statement(self, sql: str) -> None:
+        hit = sql in self._statements
+        if hit:
+            self._statements.move_to_end(sql)
+        elif self.cached_statements > 0:
+            self._statements[sql] = None
+            if len(self._statements) > self.cached_statements:
+                self._statements.popitem(last=False)
+        STATEMENT_STATS.record(sql, hit)
+
+    def cursor(self, factory=None):
+        return super().cursor(factory or TrackedCursor)
+
+    # Connection.execute создает курсор в обход переопределенного cursor().execute
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+
+def open_connection(db_name: Path, cached_statements: Optional[int] = None, **kwargs) -> TrackedConnection:
+    """Открывает TrackedConnection с кэшем на cached_statements подготовленных выражений."""
+    if cached_statements is None:
+        cached_statements = DEFAULT_CACHED_STATEMENTS
+    return sqlite3.connect(db_name, factory=TrackedConnection, cached_statements=cached_statements, **kwargs)
+
+
+class ConnectionPool:
+    """
+    Пул долгоживущих соединений с базой данных SQLite.
+
+    Соединения создаются лениво (не больше size штук) и переиспользуются
+    между вызовами Connect вместо открытия файла базы на каждый запрос.
+    Внутри одного потока соединение выдается повторно (вложенные 'with'
+    работают с одной транзакцией), перед выдачей проверяется его
+    работоспособность.
+    """
+
+    def __init__(self, db_name: Path, size: int = 5, timeout: float = 5.0, profile: Optional[str] = None,
+                 cached_statements: int = DEFAULT_CACHED_STATEMENTS):
+        """
+        Инициализирует пул соединений.
+
+        Args:
+            db_name: Имя файла базы данных SQLite.
+            size: Максимальное количество одновременно открытых соединений.
+            timeout: Сколько секунд ждать свободное соединение, если все заняты.
+            profile: Имя профиля из PROFILES для новых соединений.
+            cached_statements: Размер кэша подготовленных выражений каждого соединения.
+        """
+        if size < 1:
+            raise ValueError("Размер пула должен быть не меньше 1")
+        if profile is not None and profile not in PROFILES:
+            raise ValueError(f"Неизвестный профиль '{profile}', допустимые: {', '.join(PROFILES)}")
+        self.db_name = db_name
+        self.profile = profile
+        self.size = size
+        self.timeout = timeout
+        self._idle: queue.LifoQueue = queue.LifoQueue(maxsize=size)
+        self._created = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._closed = False
+
+    def _create_connection(self) -> sqlite3.Connection:
+        # Соединение может быть выдано разным потокам (но не одновременно)
+        conn = open_connection(self.db_name, self.cached_statements, check_same_thread=False)
+        if self.profile is not None:
+            apply_profile(conn, self.profile)
+        return conn
+
+    @staticmethod
+    def _is_healthy(conn: sqlite3.Connection) -> bool:
+        """Проверяет, что соединение живо и не осталось в незавершенной транзакции."""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            conn.execute("SELECT 1")
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _checkout(self) -> sqlite3.Connection:
+        if self._closed:
+            raise sqlite3.ProgrammingError("Пул соединений закрыт")
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_create = self._created < self.size
+                if can_create:
+                    self._created += 1
+            if can_create:
+                try:
+                    return self._create_connection()
+                except sqlite3.Error:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+            try:
+                conn = self._idle.get(timeout=self.timeout)
+            except queue.Empty:
+                raise TimeoutError(f"Нет свободных соединений в пуле за {self.timeout} с") from None
+        if not self._is_healthy(conn):
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+            conn = self._create_connection()
+        return conn
+
+    @property
+    def depth(self) -> int:
+        """Глубина вложенности 'with' для соединения текущего потока (0 - соединение не выдано)."""
+        return getattr(self._local, "depth", 0)
+
+    def acquire(self) -> sqlite3.Connection:
+        """
+        Выдает соединение текущему потоку.
+        Если поток уже держит соединение, возвращает его же.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._checkout()
+            self._local.conn = conn
+            self._local.depth = 0
+        self._local.depth += 1
+        return conn
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """Возвращает соединение в пул, когда поток выходит из самого внешнего 'with'."""
+        if getattr(self._local, "conn", None) is not conn:
+            raise sqlite3.ProgrammingError("Соединение не принадлежит текущему потоку")
+        self._local.depth -= 1
+        if self._local.depth > 0:
+            return
+        self._local.conn = None
+        if self._closed:
+            conn.close()
+            with self._lock:
+                self._created -= 1
+            return
+        self._idle.put_nowait(conn)
+
+    def close(self) -> None:
+        """Закрывает все свободные соединения. Занятые закроются при возврате в пул."""
+        self._closed = True
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            with self._lock:
+                self._created -= 1
+
+    def __enter__(self) -> "ConnectionPool":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
 
 class Connect:
@@ -8,14 +296,26 @@ class Connect:
     поддерживающий использование с оператором 'with'.
     """
 
-    def __init__(self, db_name: Path):
+    def __init__(self, db_name: Path, pool: Optional[ConnectionPool] = None, profile: Optional[str] = None,
+                 cached_statements: int = DEFAULT_CACHED_STATEMENTS):
         """
         Инициализирует объект Connect.
 
         Args:
             db_name: Имя файла базы данных SQLite.
+            pool: Пул соединений. Если задан, соединение берется из пула
+                и возвращается в него вместо закрытия.
+            profile: Имя профиля из PROFILES ("durable", "balanced", "bulk-load").
+                Для соединений из пула действует профиль пула.
+            cached_statements: Размер кэша подготовленных выражений соединения
+                (для соединений из пула - задается пулом).
         """
+        if profile is not None and profile not in PROFILES:
+            raise ValueError(f"Неизвестный профиль '{profile}', допустимые: {', '.join(PROFILES)}")
         self.db_name = db_name
+        self.pool = pool
+        self.profile = profile
+        self.cached_statements = cached_statements
         self.conn = None
         self.cursor = None
 
@@ -28,7 +328,12 @@ class Connect:
             sqlite3.Cursor: Объект курсора для выполнения SQL-запросов.
         """
         try:
-            self.conn = sqlite3.connect(self.db_name)
+            if self.pool is not None:
+                self.conn = self.pool.acquire()
+            else:
+                self.conn = open_connection(self.db_name, self.cached_statements)
+                if self.profile is not None:
+                    apply_profile(self.conn, self.profile)
             self.cursor = self.conn.cursor()
             return self.cursor
         except sqlite3.Error as e:
@@ -39,19 +344,30 @@ class Connect:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """
         Метод, вызываемый при выходе из контекстного менеджера 'with'.
-        Закрывает соединение с базой данных.
+        Закрывает соединение с базой данных (или возвращает его в пул).
 
         Args:
             exc_type: Тип исключения (если оно было).
             exc_val: Значение исключения.
             exc_tb: Объект трассировки исключения.
         """
-        if self.conn:
-            if exc_type is None:
-                # Если исключений не было, сохраняем изменения
-                self.conn.commit()
-            else:
-                # Если было исключение, откатываем изменения
-                self.conn.rollback()
-                print(f"Произошла ошибка: {exc_val}. Изменения откачены.")
+        if self.conn and self.pool is not None:
+            try:
+                # Во вложенном 'with' транзакцией управляет внешний блок
+                if self.pool.depth == 1:
+                    self._finish_transaction(exc_type, exc_val)
+            finally:
+                self.pool.release(self.conn)
+        elif self.conn:
+            self._finish_transaction(exc_type, exc_val)
             self.conn.close()
+
+    def _finish_transaction(self, exc_type, exc_val):
+        """Фиксирует или откатывает транзакцию в зависимости от наличия исключения."""
+        if exc_type is None:
+            # Если исключений не было, сохраняем изменения
+            self.conn.commit()
+        else:
+            # Если было исключение, откатываем изменения
+            self.conn.rollback()
+            print(f"Произошла ошибка: {exc_val}. Изменения откачены.")
@@ -0,0 +1,180 @@
+"""
+Построитель запросов к таблице tasks.
+
+TaskQuery описывает фильтры (статус, диапазон приоритета, подстрока в заголовке),
+сортировку и ограничение выборки (limit/offset или keyset по task_id) и
+компилируется в один параметризованный SELECT. Текст SQL зависит только от
+"формы" запроса (какие фильтры заданы и порядок сортировки), поэтому он
+кэшируется по форме, а значения передаются параметрами.
+"""
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Optional
+
+STATUSES = ('Pending', 'In Progress', 'Completed')
+ORDERS = ('ASC', 'DESC')
+
+
+def check_status(status) -> str:
+    """Проверяет статус задачи и возвращает его."""
+    if status not in STATUSES:
+        raise ValueError(f"status = {status} --> должен быть только из: 'Pending', 'In Progress', 'Completed'")
+    return status
+
+
+def check_priority(priority) -> int:
+    """Проверяет, что приоритет - целое число от 1 до 5, и возвращает его."""
+    if not isinstance(priority, int) or isinstance(priority, bool):
+        raise TypeError("Приоритет должен быть целым числом.")
+    if not 1 <= priority <= 5:
+        raise ValueError("Приоритет должен быть в диапазоне от 1 до 5.")
+    return priority
+
+
+def check_order(order: str) -> str:
+    """Проверяет направление сортировки и возвращает его в верхнем регистре."""
+    order = order.upper() if isinstance(order, str) else order
+    if order not in ORDERS:
+        raise ValueError("Параметр 'order' должен быть 'ASC' или 'DESC'.")
+    return order
+
+
+@dataclass(frozen=True)
+class TaskQuery:
+    """
+    Неизменяемое описание выборки задач. Каждый метод возвращает новый запрос:
+
+        TaskQuery().where_status("Pending").priority_between(2, 4).order_by_priority("DESC").limit(10)
+    """
+    status: Optional[str] = None
+    min_priority: Optional[int] = None
+    max_priority: Optional[int] = None
+    title_keyword: Optional[str] = None
+    priority_order: Optional[str] = None
+    limit_count: Optional[int] = None
+    offset_count: int = 0
+    after_id: Optional[int] = None
+    after_priority: Optional[int] = None
+
+    def where_status(self, status: str) -> "TaskQuery":
+        return replace(self, status=check_status(status))
+
+    def where_priority(self, priority: int) -> "TaskQuery":
+        return self.priority_between(priority, priority)
+
+    def priority_between(self, min_priority: Optional[int] = None,
+                         max_priority: Optional[int] = None) -> "TaskQuery":
+        if min_priority is not None:
+            check_priority(min_priority)
+        if max_priority is not None:
+            check_priority(max_priority)
+        if min_priority is not None and max_priority is not None and min_priority > max_priority:
+            raise ValueError("Минимальный приоритет не может быть больше максимального.")
+        return replace(self, min_priority=min_priority, max_priority=max_priority)
+
+    def title_contains(self, keyword: str) -> "TaskQuery":
+        if not isinstance(keyword, str):
+            raise TypeError("Ожидается строка для поиска в заголовке.")
+        if not keyword.strip():
+            raise ValueError("Ключевое слово не должно быть пустым.")
+        return replace(self, title_keyword=keyword)
+
+    def order_by_priority(self, order: str = 'ASC') -> "TaskQuery":
+        return replace(self, priority_order=check_order(order))
+
+    def limit(self, count: int, offset: int = 0) -> "TaskQuery":
+        if not isinstance(count, int) or count < 1:
+            raise ValueError("limit должен быть целым числом больше 0")
+        if not isinstance(offset, int) or offset < 0:
+            raise ValueError("offset должен быть целым неотрицательным числом")
+        return replace(self, limit_count=count, offset_count=offset)
+
+    def after(self, task_id: int, priority: Optional[int] = None) -> "TaskQuery":
+        """
+        Keyset-пагинация: задачи строго после задачи task_id в порядке выборки.
+        При сортировке по приоритету нужен и приоритет этой задачи.
+        """
+        if self.priority_order is not None and priority is None:
+            raise ValueError("При сортировке по приоритету для after() нужен priority")
+        return replace(self, after_id=task_id, after_priority=priority)
+
+    @property
+    def shape(self) -> tuple:
+        """Форма запроса: все, от чего зависит текст SQL (но не значения параметров)."""
+        return (
+            self.status is not None,
+            self.min_priority is not None,
+            self.max_priority is not None,
+            self.title_keyword is not None,
+            self.priority_order,
+            self.after_id is not None,
+            self.limit_count is not None,
+            self.offset_count > 0,
+        )
+
+    def params(self) -> tuple:
+        """Значения параметров в порядке плейсхолдеров скомпилированного SQL."""
+        params = []
+        if self.status is not None:
+            params.append(self.status)
+        if self.min_priority is not None:
+            params.append(self.min_priority)
+        if self.max_priority is not None:
+            params.append(self.max_priority)
+        if self.title_keyword is not None:
+            params.append(f"%{self.title_keyword}%")
+        if self.after_id is not None:
+            if self.priority_order is not None:
+                params.extend((self.after_priority, self.after_id))
+            else:
+                params.append(self.after_id)
+        if self.limit_count is not None:
+            params.append(self.limit_count)
+        if self.offset_count > 0:
+            params.append(self.offset_count)
+        return tuple(params)
+
+    def compile(self) -> tuple[str, tuple]:
+        """Возвращает (sql, params) для cursor.execute."""
+        return _compile_shape(self.shape), self.params()
+
+
+@lru_cache(maxsize=256)
+def _compile_shape(shape: tuple) -> str:
+    has_status, has_min, has_max, has_title, priority_order, has_after, has_limit, has_offset = shape
+    conditions = []
+    if has_status:
+        conditions.append("status = ?")
+    if has_min:
+        conditions.append("priority >= ?")
+    if has_max:
+        conditions.append("priority <= ?")
+    if has_title:
+        conditions.append("LOWER(title) LIKE LOWER(?)")
+    if has_after:
+        if priority_order is None:
+            conditions.append("task_id > ?")
+        else:
+            comparison = ">" if priority_order == 'ASC' else "<"
+            conditions.append(f"(priority, task_id) {comparison} (?, ?)")
+
+    sql = "SELECT * FROM tasks"
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    if priority_order is not None:
+        # task_id - однозначный порядок внутри приоритета, его дает тот же индекс
+        sql += f" ORDER BY priority {priority_order}, task_id {priority_order}"
+    elif has_after or has_limit:
+        sql += " ORDER BY task_id"
+    if has_limit:
+        sql += " LIMIT ?"
+        if has_offset:
+            sql += " OFFSET ?"
+    elif has_offset:
+        sql += " LIMIT -1 OFFSET ?"
+    return sql
+
+
+def compile_cache_info():
+    """Статистика кэша скомпилированных запросов (hits/misses/currsize)."""
+    return _compile_shape.cache_info()
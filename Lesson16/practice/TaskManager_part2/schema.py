@@ -0,0 +1,212 @@
+"""
+Управление схемой базы задач.
+
+Версия схемы хранится в PRAGMA user_version. Миграции применяются по порядку
+от текущей версии до SCHEMA_VERSION, один раз на файл базы в рамках процесса:
+после успешной проверки файл запоминается, и повторные вызовы ensure_schema
+не открывают соединение и не выполняют DDL.
+"""
+from pathlib import Path
+from typing import Callable, Optional
+import sqlite3
+import threading
+
+from connection import Connect, ConnectionPool
+
+
+def _v1_create_tasks(cursor: sqlite3.Cursor) -> None:
+    """Таблица задач."""
+    cursor.execute('''
+                CREATE TABLE IF NOT EXISTS tasks
+                (
+                    task_id     INTEGER PRIMARY KEY AUTOINCREMENT,
+                    title       TEXT NOT NULL,
+                    description TEXT,
+                    status      TEXT CHECK (status IN ('Pending', 'In Progress', 'Completed')) DEFAULT 'Pending',
+                    priority    INTEGER CHECK ( priority BETWEEN 1 AND 5) DEFAULT 3
+                );
+            ''')
+
+
+def _v2_create_filter_indexes(cursor: sqlite3.Cursor) -> None:
+    """Индексы для фильтров по статусу и приоритету (и сортировки по приоритету)."""
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_tasks_status_priority ON tasks (status, priority)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks (priority)")
+
+
+def fts5_available(cursor: sqlite3.Cursor) -> bool:
+    """Проверяет, собран ли SQLite с модулем полнотекстового поиска FTS5."""
+    try:
+        cursor.execute("CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(x)")
+        cursor.execute("DROP TABLE temp.fts5_probe")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+def _v3_create_tasks_fts(cursor: sqlite3.Cursor) -> None:
+    """
+    Полнотекстовый индекс по title и description (внешний контент - таблица tasks),
+    синхронизируется триггерами. Без FTS5 миграция ничего не делает,
+    и поиск работает через LIKE.
+    """
+    if not fts5_available(cursor):
+        return
+    cursor.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts
+        USING fts5(title, description, content='tasks', content_rowid='task_id')
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks BEGIN
+            INSERT INTO tasks_fts (rowid, title, description) VALUES (new.task_id, new.title, new.description);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks BEGIN
+            INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+            VALUES ('delete', old.task_id, old.title, old.description);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS tasks_fts_au AFTER UPDATE OF title, description ON tasks BEGIN
+            INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+            VALUES ('delete', old.task_id, old.title, old.description);
+            INSERT INTO tasks_fts (rowid, title, description) VALUES (new.task_id, new.title, new.description);
+        END
+    """)
+    # Индексируем задачи, созданные до миграции
+    cursor.execute("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')")
+
+
+def _v4_create_status_keyset_index(cursor: sqlite3.Cursor) -> None:
+    """
+    Индекс (status) - неявно (status, task_id): постраничное чтение задач
+    со статусом по task_id идет по индексу без сортировки.
+    """
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status)")
+
+
+def _v5_create_tasks_summary(cursor: sqlite3.Cursor) -> None:
+    """
+    Сводная таблица: количество задач для каждой пары (status, priority).
+    Поддерживается триггерами, поэтому статистика читается из не более чем
+    15 строк независимо от размера tasks.
+    """
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS tasks_summary
+        (
+            status   TEXT,
+            priority INTEGER,
+            count    INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (status, priority)
+        )
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS tasks_summary_ai AFTER INSERT ON tasks BEGIN
+            INSERT INTO tasks_summary (status, priority, count) VALUES (new.status, new.priority, 1)
+            ON CONFLICT (status, priority) DO UPDATE SET count = count + 1;
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS tasks_summary_ad AFTER DELETE ON tasks BEGIN
+            UPDATE tasks_summary SET count = count - 1
+            WHERE status = old.status AND priority = old.priority;
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS tasks_summary_au AFTER UPDATE OF status, priority ON tasks
+        WHEN old.status IS NOT new.status OR old.priority IS NOT new.priority BEGIN
+            UPDATE tasks_summary SET count = count - 1
+            WHERE status = old.status AND priority = old.priority;
+            INSERT INTO tasks_summary (status, priority, count) VALUES (new.status, new.priority, 1)
+            ON CONFLICT (status, priority) DO UPDATE SET count = count + 1;
+        END
+    """)
+    rebuild_tasks_summary(cursor)
+
+
+def rebuild_tasks_summary(cursor: sqlite3.Cursor) -> None:
+    """Пересчитывает tasks_summary по таблице tasks (полный проход, для восстановления)."""
+    cursor.execute("DELETE FROM tasks_summary")
+    cursor.execute("""
+        INSERT INTO tasks_summary (status, priority, count)
+        SELECT status, priority, COUNT(*) FROM tasks GROUP BY status, priority
+    """)
+
+
+# Миграция с индексом i переводит схему с версии i на версию i + 1.
+# Новые миграции добавляются только в конец списка.
+MIGRATIONS: list[Callable[[sqlite3.Cursor], None]] = [
+    _v1_create_tasks,
+    _v2_create_filter_indexes,
+    _v3_create_tasks_fts,
+    _v4_create_status_keyset_index,
+    _v5_create_tasks_summary,
+]
+SCHEMA_VERSION = len(MIGRATIONS)
+
+_ready: set[str] = set()
+_lock = threading.Lock()
+
+
+def _cache_key(db_file: Path) -> Optional[str]:
+    # Каждое соединение с ':memory:' - отдельная база, кэшировать нельзя
+    if str(db_file) == ":memory:":
+        return None
+    return str(Path(db_file).resolve())
+
+
+def get_version(cursor: sqlite3.Cursor) -> int:
+    """Возвращает текущую версию схемы базы."""
+    cursor.execute("PRAGMA user_version")
+    return cursor.fetchone()[0]
+
+
+def migrate(cursor: sqlite3.Cursor) -> int:
+    """
+    Применяет недостающие миграции в одной транзакции.
+    Возвращает версию схемы после миграции.
+    """
+    if not cursor.connection.in_transaction:
+        # IMMEDIATE: параллельный процесс дождется окончания миграции
+        cursor.execute("BEGIN IMMEDIATE")
+    version = get_version(cursor)
+    if version > SCHEMA_VERSION:
+        raise RuntimeError(
+            f"Версия схемы базы ({version}) новее поддерживаемой ({SCHEMA_VERSION})"
+        )
+    for migration in MIGRATIONS[version:]:
+        migration(cursor)
+    if version != SCHEMA_VERSION:
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    return SCHEMA_VERSION
+
+
+def ensure_schema(db_file: Path, pool: Optional[ConnectionPool] = None) -> int:
+    """
+    Приводит схему базы к SCHEMA_VERSION, если это еще не сделано в этом процессе.
+    Возвращает версию схемы.
+    """
+    key = _cache_key(db_file)
+    if key is not None and key in _ready:
+        return SCHEMA_VERSION
+    with _lock:
+        if key is not None and key in _ready:
+            return SCHEMA_VERSION
+        with Connect(db_file, pool=pool) as cursor:
+            version = migrate(cursor)
+        if key is not None:
+            _ready.add(key)
+    return version
+
+
+def forget(db_file: Optional[Path] = None) -> None:
+    """
+    Сбрасывает кэш готовности схемы для файла (или для всех файлов).
+    Нужно, если файл базы был удален или подменен во время работы процесса.
+    """
+    with _lock:
+        if db_file is None:
+            _ready.clear()
+        else:
+            _ready.discard(_cache_key(db_file))
@@ -1,6 +1,11 @@
-from connection import Connect
+from cache import LRUCache
+from connection import Connect, ConnectionPool
+from query import TaskQuery, check_priority, check_status
+import schema
 from pathlib import Path
-from typing import Optional, Literal
+from typing import Iterable, Iterator, Optional, Literal
+import re
+import sqlite3
 
 
 
@@ -8,6 +13,8 @@ class Task:
     PENDING = "Pending"
     IN_PROGRESS = "In Progress"
     COMPLETED = "Completed"
+    # Без __dict__: меньше памяти на объект и быстрее доступ к атрибутам
+    __slots__ = ("id", "title", "description", "status", "priority")
 
     def __init__(self, title, description="", status="Pending", priority=3, id = None):
         self.id = id
@@ -16,6 +23,13 @@ class Task:
         self.status = status
         self.priority = priority
 
+    @classmethod
+    def from_row(cls, row: tuple) -> "Task":
+        """Создает задачу из строки таблицы tasks (task_id, title, description, status, priority) без вызова __init__."""
+        task = cls.__new__(cls)
+        task.id, task.title, task.description, task.status, task.priority = row
+        return task
+
     def __repr__(self):
         return f"Task(id={self.id}, title='{self.title}', description = '{self.description}', status = '{self.status}', priority={self.priority})"
 
@@ -38,43 +52,143 @@ class Task:
             raise ValueError("new_priority должен быть в диапазоне от 1 до 5")
 
 
+def task_row_factory(cursor: sqlite3.Cursor, row: tuple) -> Task:
+    """row_factory для sqlite3: курсор сразу возвращает Task вместо кортежа."""
+    return Task.from_row(row)
+
+
 class TaskRepository:
     DB_FILE = Path("tasks.db")
     # Типы
     StatusType = Literal["Pending", "In Progress", "Completed"]
     PriorityType = Literal[1, 2, 3, 4, 5]
     Order_byType = Literal["ASC", "DESC"]
+    # Запросы методов с примерами параметров - для проверки планов выполнения
+    QUERY_PLAN_CHECKS = {
+        "get_by_id": ("SELECT * FROM tasks WHERE task_id = ?", (1,)),
+        "get_all_tasks": ("SELECT * FROM tasks", ()),
+        "get_tasks_by_status": TaskQuery().where_status("Pending").compile(),
+        "get_tasks_by_priority": TaskQuery().where_priority(3).compile(),
+        "get_completed_tasks": TaskQuery().where_status("Completed").compile(),
+        "get_tasks_by_title_contains": TaskQuery().title_contains("a").compile(),
+        "get_tasks_by_priority_range": TaskQuery().priority_between(1, 5).order_by_priority().compile(),
+        "get_all_tasks_sorted_by_priority": TaskQuery().order_by_priority().compile(),
+        "get_tasks_by_status_sorted_by_priority": TaskQuery().where_status("Pending").order_by_priority().compile(),
+        "delete_completed_tasks": ("DELETE FROM tasks WHERE status = 'Completed'", ()),
+    }
+    # Методы, которым полный просмотр таблицы нужен по смыслу
+    FULL_SCAN_EXPECTED = {"get_all_tasks", "get_all_tasks_sorted_by_priority"}
+
+    def __init__(self, pool: Optional[ConnectionPool] = None, db_file: Optional[Path] = None,
+                 cache_size: int = 0, cache_ttl: Optional[float] = None, profile: Optional[str] = None):
+        """
+        Args:
+            pool: Пул соединений. Если задан, все методы переиспользуют его
+                соединения вместо открытия файла базы на каждый вызов.
+            db_file: Файл базы данных (по умолчанию DB_FILE или файл пула).
+            cache_size: Размер LRU-кэша для get_by_id (0 - без кэша).
+                Кэш сбрасывается при изменениях через этот репозиторий;
+                изменения из других процессов видны не позже чем через cache_ttl.
+            cache_ttl: Время жизни записи кэша в секундах (None - бессрочно).
+            profile: Профиль настроек SQLite из connection.PROFILES для соединений
+                без пула (у пула свой профиль).
+        """
+        self.pool = pool
+        self.profile = profile
+        self.cache = LRUCache(cache_size, cache_ttl) if cache_size else None
+        if db_file is not None:
+            self.DB_FILE = Path(db_file)
+        elif pool is not None:
+            self.DB_FILE = Path(pool.db_name)
+        self._ensure_db_table_exists()
+        self.fts_enabled = self._has_fts_index()
 
-    def __init__(self):
-        TaskRepository._ensure_db_table_exists()
+    def _connect(self) -> Connect:
+        """Создает контекстный менеджер подключения (через пул, если он задан)."""
+        return Connect(self.DB_FILE, pool=self.pool, profile=self.profile)
 
     @staticmethod
     def _map_rows_to_tasks(tasks_data: list[tuple]) -> list[Task]:
-        tasks = []
-        for data in tasks_data:
-            tasks.append(Task(*data[1:], data[0]))
-        return tasks
+        return [Task.from_row(data) for data in tasks_data]
+
+    @staticmethod
+    def _fetch_tasks(cursor: sqlite3.Cursor) -> list[Task]:
+        """Читает все строки результата сразу как Task (через row_factory курсора)."""
+        cursor.row_factory = task_row_factory
+        return cursor.fetchall()
+
+    def _ensure_db_table_exists(self):
+        """Создает таблицы и применяет миграции (один раз на файл базы в процессе)."""
+        schema.ensure_schema(self.DB_FILE, self.pool)
+
+    def _invalidate_cache(self, *ids):
+        """Убирает задачи из кэша get_by_id (без аргументов - очищает кэш целиком)."""
+        if self.cache is None:
+            return
+        if ids:
+            self.cache.invalidate(*ids)
+        else:
+            self.cache.clear()
+
+    def cache_stats(self) -> dict:
+        """Счетчики попаданий/промахов кэша get_by_id (пустой словарь, если кэш выключен)."""
+        return self.cache.stats() if self.cache is not None else {}
+
+    def _has_fts_index(self) -> bool:
+        """Есть ли в базе полнотекстовый индекс tasks_fts."""
+        with self._connect() as cursor:
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tasks_fts'")
+            return cursor.fetchone() is not None
+
+    @staticmethod
+    def _build_match_query(text: str, column: Optional[str] = None, prefix: bool = True) -> str:
+        """
+        Строит выражение FTS5 MATCH: все слова из text должны встретиться (AND).
+        Каждое слово берется в кавычки, поэтому спецсимволы FTS5 не интерпретируются.
+        """
+        words = re.findall(r"\w+", text)
+        if not words:
+            raise ValueError("Поисковый запрос не содержит слов.")
+        star = "*" if prefix else ""
+        scope = f"{column} : " if column else ""
+        return " AND ".join(f'{scope}"{word}"{star}' for word in words)
+
+    def search(self, text: str, prefix: bool = True, limit: Optional[int] = None) -> list[Task]:
+        """
+        Полнотекстовый поиск по заголовку и описанию, самые релевантные задачи первыми.
+        prefix=True находит слова, начинающиеся с введенных ("молок" -> "молоко").
+        Без FTS5 выполняется поиск подстроки через LIKE без ранжирования.
+        """
+        if not isinstance(text, str):
+            raise TypeError("Ожидается строка для поиска.")
+        if not text.strip():
+            raise ValueError("Поисковый запрос не должен быть пустым.")
+        limit_sql = "LIMIT ?" if limit is not None else ""
+        limit_params = (limit,) if limit is not None else ()
+        if self.fts_enabled:
+            sql_select = f"""
+            SELECT tasks.* FROM tasks_fts
+            JOIN tasks ON tasks.task_id = tasks_fts.rowid
+            WHERE tasks_fts MATCH ?
+            ORDER BY rank {limit_sql}
+            """
+            params = (self._build_match_query(text, prefix=prefix), *limit_params)
+        else:
+            sql_select = f"""
+            SELECT * FROM tasks
+            WHERE LOWER(title) LIKE LOWER(?) OR LOWER(description) LIKE LOWER(?) {limit_sql}
+            """
+            pattern = f"%{text.strip()}%"
+            params = (pattern, pattern, *limit_params)
+        with self._connect() as cursor:
+            cursor.execute(sql_select, params)
+            return self._fetch_tasks(cursor)
 
-    @classmethod
-    def _ensure_db_table_exists(cls):
-        """Создает таблицу tasks, если она еще не существует."""
-        with Connect(cls.DB_FILE) as cursor:
-            cursor.execute('''
-                        CREATE TABLE IF NOT EXISTS tasks
-                        (
-                            task_id     INTEGER PRIMARY KEY AUTOINCREMENT,
-                            title       TEXT NOT NULL,
-                            description TEXT,
-                            status      TEXT CHECK (status IN ('Pending', 'In Progress', 'Completed')) DEFAULT 'Pending',
-                            priority    INTEGER CHECK ( priority BETWEEN 1 AND 5) DEFAULT 3
-                        );
-                    ''')
     def save(self, task: Task):
         """
         Сохраняет или обновляет задачу в базе данных.
         Если id None, вставляет новую задачу. Иначе, обновляет существующую.
         """
-        self._ensure_db_table_exists()
         sql_insert = "INSERT INTO tasks (title, description, status, priority) VALUES (?, ?, ?, ?)"
         sql_update =  """
             UPDATE tasks 
@@ -82,32 +196,132 @@ class TaskRepository:
             WHERE task_id = ?;
         """
         if task.id:
-            with Connect(TaskRepository.DB_FILE) as cursor:
+            with self._connect() as cursor:
                 cursor.execute(sql_update, (task.title, task.description, task.status, task.priority, task.id))
+            self._invalidate_cache(task.id)
         else:
-            with Connect(TaskRepository.DB_FILE) as cursor:
+            with self._connect() as cursor:
                 cursor.execute(sql_insert, (task.title, task.description, task.status, task.priority))
                 task.id = cursor.lastrowid
 
+    def save_many(self, tasks: Iterable[Task], chunk_size: int = 1000) -> int:
+        """
+        Пакетно сохраняет задачи в одной транзакции.
+        Новые задачи (id None) вставляются, остальные обновляются через executemany
+        порциями по chunk_size строк. Новым задачам проставляется id.
+        Возвращает количество обработанных задач.
+        """
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError("chunk_size должен быть целым числом больше 0")
+        sql_insert = "INSERT INTO tasks (title, description, status, priority) VALUES (?, ?, ?, ?)"
+        sql_update = """
+            UPDATE tasks 
+            SET title = ?, description = ?, status = ?, priority = ?
+            WHERE task_id = ?;
+        """
+        new_tasks = []
+        existing_tasks = []
+        for task in tasks:
+            (existing_tasks if task.id else new_tasks).append(task)
+
+        with self._connect() as cursor:
+            for start in range(0, len(existing_tasks), chunk_size):
+                chunk = existing_tasks[start:start + chunk_size]
+                cursor.executemany(sql_update, [(t.title, t.description, t.status, t.priority, t.id) for t in chunk])
+            for start in range(0, len(new_tasks), chunk_size):
+                chunk = new_tasks[start:start + chunk_size]
+                cursor.executemany(sql_insert, [(t.title, t.description, t.status, t.priority) for t in chunk])
+                # Внутри одной транзакции AUTOINCREMENT выдает id подряд,
+                # поэтому id порции восстанавливаются от последнего вставленного
+                cursor.execute("SELECT last_insert_rowid()")
+                last_id = cursor.fetchone()[0]
+                for offset, task in enumerate(chunk):
+                    task.id = last_id - len(chunk) + 1 + offset
+        if existing_tasks:
+            self._invalidate_cache(*(task.id for task in existing_tasks))
+        return len(new_tasks) + len(existing_tasks)
+
     def get_by_id(self, id) -> Optional['Task']:
         sql_select = "SELECT * FROM tasks WHERE task_id = ?"
-        with Connect(self.DB_FILE) as cursor:
+        generation = None
+        if self.cache is not None:
+            # В кэше лежат неизменяемые строки, каждый вызов получает свой Task
+            row = self.cache.get(id)
+            if row is not None:
+                return Task.from_row(row)
+            generation = self.cache.generation
+        with self._connect() as cursor:
             cursor.execute(sql_select, (id,))
             data = cursor.fetchone()
-            if data is not None:
-                # return Task(id=data[0], title=data[1], description=data[2], status=data[3], priority=data[4])
-                return Task(*data[1:], data[0])#
-            else:
-                print(f"Задача с id={id} отсутствует")
-                return None
+        if data is not None:
+            if self.cache is not None:
+                self.cache.put(id, data, generation)
+            return Task.from_row(data)
+        else:
+            print(f"Задача с id={id} отсутствует")
+            return None
 
     def get_all_tasks(self) -> list['Task']:
         sql_select = "SELECT * FROM tasks"
-        with Connect(self.DB_FILE) as cursor:
+        with self._connect() as cursor:
             cursor.execute(sql_select)
-            return self._map_rows_to_tasks(cursor.fetchall())
+            return self._fetch_tasks(cursor)
+
 
 
+    def _iter_pages(self, where: str, params: tuple, page_size: int) -> Iterator[Task]:
+        """
+        Постранично читает задачи по возрастанию task_id (keyset-пагинация:
+        WHERE task_id > последний_id LIMIT page_size) и отдает их по одной.
+        В памяти одновременно находится не больше одной страницы, соединение
+        берется заново на каждую страницу и не удерживается между ними.
+        """
+        if not isinstance(page_size, int) or page_size < 1:
+            raise ValueError("page_size должен быть целым числом больше 0")
+        condition = f"({where}) AND " if where else ""
+        sql_select = f"SELECT * FROM tasks WHERE {condition}task_id > ? ORDER BY task_id LIMIT ?"
+
+        def pages() -> Iterator[Task]:
+            last_id = 0
+            while True:
+                with self._connect() as cursor:
+                    cursor.execute(sql_select, (*params, last_id, page_size))
+                    page = self._fetch_tasks(cursor)
+                yield from page
+                if len(page) < page_size:
+                    return
+                last_id = page[-1].id
+
+        return pages()
+
+    def iter_all_tasks(self, page_size: int = 1000) -> Iterator[Task]:
+        """Потоковый вариант get_all_tasks: задачи по возрастанию id страницами по page_size."""
+        return self._iter_pages("", (), page_size)
+
+    def iter_tasks_by_status(self, status: StatusType, page_size: int = 1000) -> Iterator[Task]:
+        """Потоковый вариант get_tasks_by_status."""
+        check_status(status)
+        return self._iter_pages("status = ?", (status,), page_size)
+
+    def iter_completed_tasks(self, page_size: int = 1000) -> Iterator[Task]:
+        """Потоковый вариант get_completed_tasks."""
+        return self._iter_pages("status = 'Completed'", (), page_size)
+
+    def iter_tasks_by_priority(self, priority: PriorityType, page_size: int = 1000) -> Iterator[Task]:
+        """Потоковый вариант get_tasks_by_priority."""
+        check_priority(priority)
+        return self._iter_pages("priority = ?", (priority,), page_size)
+
+    def iter_tasks_by_priority_range(self, min_priority: PriorityType, max_priority: PriorityType,
+                                     page_size: int = 1000) -> Iterator[Task]:
+        """Потоковый вариант get_tasks_by_priority_range (порядок - по id, а не по приоритету)."""
+        check_priority(min_priority)
+        check_priority(max_priority)
+        if min_priority > max_priority:
+            raise ValueError("Минимальный приоритет не может быть больше максимального.")
+        # '+' отключает индекс по priority: идем по первичному ключу и останавливаемся
+        # на заполненной странице вместо сортировки всех подходящих строк
+        return self._iter_pages("+priority BETWEEN ? AND ?", (min_priority, max_priority), page_size)
 
     def delete(self, task: Task):
         """Удаляет задачу из базы данных."""
@@ -115,102 +329,70 @@ class TaskRepository:
         if task is None or task.id is None:
             print("Нельзя удалить: задача отсутствует или не имеет id")
             return
-        with Connect(self.DB_FILE) as cursor:
+        with self._connect() as cursor:
             cursor.execute(sql_delete, (task.id,))
             if cursor.rowcount > 0:
                 print(f"Задача с id={task.id} удалена")
             else:
                 print(f"Задача с id={task.id} не найдена")
-            task.id = None
+        self._invalidate_cache(task.id)
+        task.id = None
+
+    def find(self, query: TaskQuery) -> list[Task]:
+        """Выполняет запрос TaskQuery одним SELECT (любая комбинация фильтров, сортировки и limit)."""
+        sql_select, params = query.compile()
+        with self._connect() as cursor:
+            cursor.execute(sql_select, params)
+            return self._fetch_tasks(cursor)
 
     def get_tasks_by_status(self, status: StatusType) -> list[Task]:
     # Возвращает список зада с определенным статусом.
-        sql_select = "SELECT * FROM tasks WHERE status = ?"
-        if status  in ['Pending', 'In Progress', 'Completed']:
-            raise ValueError(f"status = {status} --> должен быть только из: 'Pending', 'In Progress', 'Completed'")
-        with Connect(self.DB_FILE) as cursor:
-            cursor.execute(sql_select, (status,))
-            return self._map_rows_to_tasks(cursor.fetchall())
+        return self.find(TaskQuery().where_status(status))
 
     def get_tasks_by_priority(self, priority: PriorityType) -> list[Task]:
     # Возвращает список задач с определенным приоритетом.
-        sql_select = "SELECT * FROM tasks WHERE priority = ?"
-        if isinstance(priority, int) and 1 <= priority <= 5:
-            with Connect(self.DB_FILE) as cursor:
-                cursor.execute(sql_select, (priority,))
-                return self._map_rows_to_tasks(cursor.fetchall())
-        else:
-            raise ValueError(f"priority --> должен быть integer или : 1 <= priority <= 5")
+        return self.find(TaskQuery().where_priority(priority))
 
     def get_completed_tasks(self) -> list[Task]:
     # Специализированный метод для получения всех завершенных задач.
-        sql_select = "SELECT * FROM tasks WHERE status = 'Completed'"
-        with Connect(self.DB_FILE) as cursor:
-            cursor.execute(sql_select)
-            return self._map_rows_to_tasks(cursor.fetchall())
+        return self.find(TaskQuery().where_status(Task.COMPLETED))
 
 
-    def get_tasks_by_title_contains(self, keyword: str) -> list[Task]:
+    def get_tasks_by_title_contains(self, keyword: str, full_text: bool = False) -> list[Task]:
     # Поиск задач по ключевому слову в заголовке.
-        if not isinstance(keyword, str):
-            raise TypeError("Ожидается строка для поиска в заголовке.")
-        if not keyword.strip():
-            raise ValueError("Ключевое слово не должно быть пустым.") # если отправить пустую строку, выдаст всю базу, такая функция уже есть
-        sql_select = "SELECT * FROM tasks WHERE LOWER(title) LIKE LOWER(?)"
-        pattern = f"%{keyword}%"
-        with Connect(self.DB_FILE) as cursor:
-            cursor.execute(sql_select, (pattern,))
-            return self._map_rows_to_tasks(cursor.fetchall())
+    # full_text=True - поиск по началу слов через индекс FTS5 с ранжированием (если FTS5 доступен).
+        query = TaskQuery().title_contains(keyword) # пустая строка запрещена: выдала бы всю базу, такая функция уже есть
+        if full_text and self.fts_enabled:
+            sql_select = """
+            SELECT tasks.* FROM tasks_fts
+            JOIN tasks ON tasks.task_id = tasks_fts.rowid
+            WHERE tasks_fts MATCH ?
+            ORDER BY rank
+            """
+            with self._connect() as cursor:
+                cursor.execute(sql_select, (self._build_match_query(keyword, column="title"),))
+                return self._fetch_tasks(cursor)
+        return self.find(query)
 
     def get_tasks_by_priority_range(self, min_priority: PriorityType, max_priority: PriorityType, order: Order_byType = 'ASC') -> list[Task]:
     # Задачи в заданном диапазоне приоритетов. Методы получения задач с сортировкой:
-        if not all(isinstance(p, int) for p in (min_priority, max_priority)):
+        if min_priority is None or max_priority is None:
             raise TypeError("Оба значения должны быть целыми числами.")
-        if not (1 <= min_priority <= 5 and 1 <= max_priority <= 5):
-            raise ValueError("Приоритет должен быть в диапазоне от 1 до 5.")
-        if min_priority > max_priority:
-            raise ValueError("Минимальный приоритет не может быть больше максимального.")
-        order = order.upper()
-        if order not in ['ASC', 'DESC']:
-            raise ValueError("Параметр 'order' должен быть 'ASC' или 'DESC'.")
-        sql_select = f"""
-        SELECT * FROM tasks 
-        WHERE priority BETWEEN ? AND ?
-        ORDER BY priority {order}
-        """
-        with Connect(self.DB_FILE) as cursor:
-            cursor.execute(sql_select, (min_priority, max_priority))
-            return self._map_rows_to_tasks(cursor.fetchall())
+        return self.find(TaskQuery().priority_between(min_priority, max_priority).order_by_priority(order))
 
     def get_all_tasks_sorted_by_priority(self, order: Order_byType = 'ASC', ascending: bool = True) -> list[Task]:
     # Получает все задачи, отсортированные по приоритету.
-        order = order.upper()
-        if order not in ['ASC', 'DESC']:
-            raise ValueError("Параметр 'order' должен быть 'ASC' или 'DESC'.")
-        sql_select = f"SELECT * FROM tasks ORDER BY priority {order}"
+        query = TaskQuery().order_by_priority(order)
         if ascending:
-            with Connect(self.DB_FILE) as cursor:
-                cursor.execute(sql_select)
-                return self._map_rows_to_tasks(cursor.fetchall())
+            return self.find(query)
         else:
             return []
 
     def get_tasks_by_status_sorted_by_priority(self, status: StatusType, order: Order_byType = 'ASC', ascending: bool = True) -> list[Task]:
         #Получает задачи по статусу, отсортированные по приоритету.
-        if status not in ['Pending', 'In Progress', 'Completed']:
-            error_text = f"status = {status} --> должен быть только из: 'Pending', 'In Progress', 'Completed'"
-            raise ValueError(error_text)
-        order = order.upper()
-        if order not in ['ASC', 'DESC']:
-            raise ValueError("Параметр 'order' должен быть 'ASC' или 'DESC'.")
-        sql = f"""
-        SELECT * FROM tasks 
-        WHERE status = ? ORDER BY priority {order}
-        """
+        query = TaskQuery().where_status(status).order_by_priority(order)
         if ascending:
-            with Connect(self.DB_FILE) as cursor:
-                cursor.execute(sql, (status,))
-                return self._map_rows_to_tasks(cursor.fetchall())
+            return self.find(query)
         else:
             return []
 
@@ -221,25 +403,184 @@ class TaskRepository:
                    WHERE status = 'Completed'
                    """
         try:
-            with Connect(self.DB_FILE) as cursor:
+            with self._connect() as cursor:
                 cursor.execute(sql)
                 deleted_count = cursor.rowcount # возвращает количество строк, затронутых последней операцией
-                print(f"удалено задач: {deleted_count}")
-                return deleted_count
         except Exception as e:
             raise Exception(f"Произошла непредвиденная ошибка при удалении завершенных задач: {e}") from e
+        self._invalidate_cache()
+        print(f"удалено задач: {deleted_count}")
+        return deleted_count
 
     def delete_all_tasks(self) -> int:
     # Удаляет все задачи со статусом "Завершено".
         sql = f"DELETE FROM tasks"
         try:
-            with Connect(self.DB_FILE) as cursor:
+            with self._connect() as cursor:
                 cursor.execute(sql)
                 deleted_count = cursor.rowcount # возвращает количество строк, затронутых последней операцией
-                print(f"удалено задач: {deleted_count}")
-                return deleted_count
         except Exception as e:
             raise Exception(f"Произошла непредвиденная ошибка при удалении задач: {e}") from e
+        self._invalidate_cache()
+        print(f"удалено задач: {deleted_count}")
+        return deleted_count
+
+    # Параметров в одном запросе не больше 999 (ограничение старых сборок SQLite)
+    MAX_SQL_VARIABLES = 999
+
+    def mark_by_ids(self, ids: Iterable[int], status: StatusType, chunk_size: int = 500) -> int:
+        """
+        Пакетный аналог Task.mark_as_*: устанавливает status задачам с id из ids.
+        Выполняет UPDATE ... WHERE task_id IN (...) порциями по chunk_size id
+        в одной транзакции. Возвращает количество измененных задач
+        (задачи, у которых статус уже такой, не считаются).
+        """
+        check_status(status)
+        if not isinstance(chunk_size, int) or not 1 <= chunk_size < self.MAX_SQL_VARIABLES:
+            raise ValueError(f"chunk_size должен быть целым числом от 1 до {self.MAX_SQL_VARIABLES - 1}")
+        ids = list(dict.fromkeys(ids))
+        updated = 0
+        with self._connect() as cursor:
+            for start in range(0, len(ids), chunk_size):
+                chunk = ids[start:start + chunk_size]
+                placeholders = ", ".join("?" * len(chunk))
+                cursor.execute(
+                    f"UPDATE tasks SET status = ? WHERE task_id IN ({placeholders}) AND status IS NOT ?",
+                    (status, *chunk, status),
+                )
+                updated += cursor.rowcount
+        if ids:
+            self._invalidate_cache(*ids)
+        return updated
+
+    def mark_where(self, status: StatusType, from_status: Optional[StatusType] = None,
+                   min_priority: Optional[PriorityType] = None, max_priority: Optional[PriorityType] = None) -> int:
+        """
+        Устанавливает status всем задачам, подходящим под условие, одним UPDATE:
+        from_status - текущий статус, min_priority/max_priority - диапазон приоритета.
+        Без условий меняет статус всем задачам. Возвращает количество измененных задач.
+        """
+        check_status(status)
+        if from_status is not None:
+            check_status(from_status)
+        for priority in (min_priority, max_priority):
+            if priority is not None:
+                check_priority(priority)
+        conditions = ["status IS NOT ?"]
+        params = [status]
+        if from_status is not None:
+            conditions.append("status = ?")
+            params.append(from_status)
+        if min_priority is not None:
+            conditions.append("priority >= ?")
+            params.append(min_priority)
+        if max_priority is not None:
+            conditions.append("priority <= ?")
+            params.append(max_priority)
+        sql_update = f"UPDATE tasks SET status = ? WHERE {' AND '.join(conditions)}"
+        with self._connect() as cursor:
+            cursor.execute(sql_update, (status, *params))
+            updated = cursor.rowcount
+        if updated:
+            self._invalidate_cache()
+        return updated
+
+    def mark_by_priority_range(self, status: StatusType, min_priority: PriorityType,
+                               max_priority: PriorityType) -> int:
+        """Устанавливает status задачам с приоритетом от min_priority до max_priority."""
+        if min_priority > max_priority:
+            raise ValueError("Минимальный приоритет не может быть больше максимального.")
+        return self.mark_where(status, min_priority=min_priority, max_priority=max_priority)
+
+    def count_by_status(self) -> dict[str, int]:
+        """Количество задач по статусам (все статусы присутствуют, в том числе с нулем)."""
+        counts = {status: 0 for status in ('Pending', 'In Progress', 'Completed')}
+        with self._connect() as cursor:
+            cursor.execute("SELECT status, SUM(count) FROM tasks_summary GROUP BY status")
+            counts.update(cursor.fetchall())
+        return counts
+
+    def count_by_priority(self) -> dict[int, int]:
+        """Количество задач по приоритетам 1..5."""
+        counts = {priority: 0 for priority in range(1, 6)}
+        with self._connect() as cursor:
+            cursor.execute("SELECT priority, SUM(count) FROM tasks_summary GROUP BY priority")
+            counts.update(cursor.fetchall())
+        return counts
+
+    def status_priority_histogram(self) -> dict[tuple[str, int], int]:
+        """Количество задач для каждой пары (статус, приоритет), у которой есть задачи."""
+        with self._connect() as cursor:
+            cursor.execute("SELECT status, priority, count FROM tasks_summary WHERE count > 0 "
+                           "ORDER BY status, priority")
+            return {(status, priority): count for status, priority, count in cursor.fetchall()}
+
+    def completion_ratio(self) -> float:
+        """Доля завершенных задач (0.0 для пустой базы)."""
+        by_status = self.count_by_status()
+        total = sum(by_status.values())
+        return by_status['Completed'] / total if total else 0.0
+
+    def stats(self) -> dict:
+        """
+        Сводная статистика для дашборда одним запросом к tasks_summary:
+        всего задач, по статусам, по приоритетам, гистограмма статус x приоритет
+        и доля завершенных.
+        """
+        with self._connect() as cursor:
+            cursor.execute("SELECT status, priority, count FROM tasks_summary WHERE count > 0")
+            rows = cursor.fetchall()
+        by_status = {status: 0 for status in ('Pending', 'In Progress', 'Completed')}
+        by_priority = {priority: 0 for priority in range(1, 6)}
+        histogram = {}
+        for status, priority, count in rows:
+            by_status[status] = by_status.get(status, 0) + count
+            by_priority[priority] = by_priority.get(priority, 0) + count
+            histogram[(status, priority)] = count
+        total = sum(by_status.values())
+        return {
+            "total": total,
+            "by_status": by_status,
+            "by_priority": by_priority,
+            "by_status_priority": histogram,
+            "completion_ratio": by_status['Completed'] / total if total else 0.0,
+        }
+
+    def rebuild_stats(self) -> None:
+        """Пересчитывает сводную таблицу по tasks (если она разошлась, например после ручной правки базы)."""
+        with self._connect() as cursor:
+            schema.rebuild_tasks_summary(cursor)
+
+    def explain_queries(self) -> dict[str, dict]:
+        """
+        Выполняет EXPLAIN QUERY PLAN для каждого запроса репозитория.
+        Для каждого метода возвращает план (строки detail) и флаги:
+        full_scan - таблица tasks читается целиком без индекса,
+        temp_sort - для ORDER BY строится временное B-дерево.
+        """
+        report = {}
+        with self._connect() as cursor:
+            for name, (sql, params) in self.QUERY_PLAN_CHECKS.items():
+                cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+                plan = [row[3] for row in cursor.fetchall()]
+                report[name] = {
+                    "plan": plan,
+                    "full_scan": any(detail.split()[:2] == ["SCAN", "tasks"] and "USING" not in detail
+                                     for detail in plan),
+                    "temp_sort": any("TEMP B-TREE" in detail for detail in plan),
+                }
+        return report
+
+    def print_query_plan_report(self):
+        """Выводит методы, запросы которых читают таблицу целиком или сортируют во временном дереве."""
+        for name, info in self.explain_queries().items():
+            problems = []
+            if info["full_scan"] and name not in self.FULL_SCAN_EXPECTED:
+                problems.append("полный просмотр таблицы")
+            if info["temp_sort"]:
+                problems.append("сортировка без индекса")
+            status = ", ".join(problems) if problems else "ok"
+            print(f"{name}: {status} | {'; '.join(info['plan'])}")
 
 ###################################
 #
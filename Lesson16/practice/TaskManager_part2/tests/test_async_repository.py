@@ -0,0 +1,67 @@
+import asyncio
+import threading
+
+from async_repository import AsyncTaskRepository
+from connection import Connect
+from solution import Task, TaskRepository
+
+
+def test_async_save_and_read(tmp_path):
+    """
+    Тест: Корутины сохраняют и читают задачи, конкурентные чтения не мешают друг другу.
+    """
+    async def scenario():
+        async with AsyncTaskRepository(tmp_path / "tasks.db", readers=2) as repository:
+            await repository.save_many(Task(f"задача {i}", priority=i % 5 + 1) for i in range(10))
+            task = Task("купить хлеб", status=Task.COMPLETED)
+            await repository.save(task)
+            results = await asyncio.gather(
+                repository.get_by_id(task.id),
+                repository.get_all_tasks(),
+                repository.get_tasks_by_priority(1),
+                repository.get_completed_tasks(),
+            )
+            assert await repository.delete_completed_tasks() == 1
+            return results
+
+    by_id, all_tasks, by_priority, completed = asyncio.run(scenario())
+    assert by_id.title == "купить хлеб"
+    assert len(all_tasks) == 11
+    assert len(by_priority) == 2
+    assert [task.title for task in completed] == ["купить хлеб"]
+
+
+def test_async_writes_use_single_thread(tmp_path, monkeypatch):
+    """
+    Тест: Все изменения выполняются в одном потоке-писателе.
+    """
+    threads = set()
+    original_save = TaskRepository.save
+
+    def tracking_save(self, task):
+        threads.add(threading.current_thread().name)
+        original_save(self, task)
+
+    monkeypatch.setattr(TaskRepository, "save", tracking_save)
+
+    async def scenario():
+        async with AsyncTaskRepository(tmp_path / "tasks.db") as repository:
+            await asyncio.gather(*(repository.save(Task(f"задача {i}")) for i in range(20)))
+            return len(await repository.get_all_tasks())
+
+    assert asyncio.run(scenario()) == 20
+    assert len(threads) == 1 and threads.pop().startswith("tasks-writer")
+
+
+def test_async_enables_wal(tmp_path):
+    """
+    Тест: База переводится в режим WAL.
+    """
+    async def scenario():
+        async with AsyncTaskRepository(tmp_path / "tasks.db"):
+            pass
+
+    asyncio.run(scenario())
+    with Connect(tmp_path / "tasks.db") as cursor:
+        cursor.execute("PRAGMA journal_mode")
+        assert cursor.fetchone()[0] == "wal"
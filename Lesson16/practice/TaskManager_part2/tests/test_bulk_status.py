@@ -0,0 +1,53 @@
+import pytest
+
+from solution import Task, TaskRepository
+
+
+@pytest.fixture
+def repository(tmp_path):
+    """Фикстура Pytest: репозиторий с 20 задачами Pending, приоритеты 1..5 по кругу."""
+    repository = TaskRepository(db_file=tmp_path / "tasks.db", cache_size=10)
+    repository.save_many([Task(f"задача {i}", priority=i % 5 + 1) for i in range(20)])
+    return repository
+
+
+def test_mark_by_ids_chunked(repository):
+    """
+    Тест: mark_by_ids меняет статус по списку id порциями и возвращает число измененных.
+    """
+    ids = [task.id for task in repository.get_all_tasks()][:7]
+    repository.get_by_id(ids[0])  # задача попадает в кэш
+    assert repository.mark_by_ids(ids + [ids[0], 10_000], Task.COMPLETED, chunk_size=3) == 7
+    assert sorted(task.id for task in repository.get_completed_tasks()) == sorted(ids)
+    assert repository.get_by_id(ids[0]).status == Task.COMPLETED
+    # Повторная установка того же статуса ничего не меняет
+    assert repository.mark_by_ids(ids, Task.COMPLETED) == 0
+
+
+def test_mark_where(repository):
+    """
+    Тест: mark_where меняет статус по условию одним запросом.
+    """
+    assert repository.mark_where(Task.IN_PROGRESS, min_priority=4) == 8
+    assert repository.mark_where(Task.COMPLETED, from_status=Task.IN_PROGRESS, max_priority=4) == 4
+    assert repository.count_by_status() == {"Pending": 12, "In Progress": 4, "Completed": 4}
+
+
+def test_mark_by_priority_range(repository):
+    """
+    Тест: mark_by_priority_range меняет статус задачам из диапазона приоритетов.
+    """
+    assert repository.mark_by_priority_range(Task.COMPLETED, 2, 3) == 8
+    assert {task.priority for task in repository.get_completed_tasks()} == {2, 3}
+    with pytest.raises(ValueError):
+        repository.mark_by_priority_range(Task.COMPLETED, 4, 2)
+
+
+def test_mark_validates_status(repository):
+    """
+    Тест: Недопустимый статус - ValueError.
+    """
+    with pytest.raises(ValueError):
+        repository.mark_by_ids([1], "Done")
+    with pytest.raises(ValueError):
+        repository.mark_where(Task.COMPLETED, from_status="Done")
@@ -0,0 +1,93 @@
+import pytest
+
+from cache import LRUCache
+from solution import Task, TaskRepository
+
+
+@pytest.fixture
+def repository(tmp_path):
+    """Фикстура Pytest: репозиторий с кэшем get_by_id на 2 записи."""
+    return TaskRepository(db_file=tmp_path / "tasks.db", cache_size=2)
+
+
+def test_lru_evicts_least_recently_used():
+    """
+    Тест: При переполнении вытесняется давно не использованная запись.
+    """
+    cache = LRUCache(maxsize=2)
+    cache.put(1, "a")
+    cache.put(2, "b")
+    cache.get(1)
+    cache.put(3, "c")
+    assert cache.get(2) is None
+    assert cache.get(1) == "a" and cache.get(3) == "c"
+
+
+def test_lru_ttl(monkeypatch):
+    """
+    Тест: Запись старше ttl считается отсутствующей.
+    """
+    now = [100.0]
+    monkeypatch.setattr("cache.time.monotonic", lambda: now[0])
+    cache = LRUCache(maxsize=2, ttl=5)
+    cache.put(1, "a")
+    now[0] += 6
+    assert cache.get(1) is None
+
+
+def test_lru_stale_put_ignored():
+    """
+    Тест: Значение, прочитанное до инвалидации, в кэш не попадает.
+    """
+    cache = LRUCache(maxsize=2)
+    generation = cache.generation
+    cache.invalidate(1)
+    cache.put(1, "устарело", generation)
+    assert cache.get(1) is None
+
+
+def test_get_by_id_hits_cache(repository):
+    """
+    Тест: Повторный get_by_id берется из кэша, каждый раз новый объект Task.
+    """
+    task = Task("купить хлеб")
+    repository.save(task)
+    first = repository.get_by_id(task.id)
+    second = repository.get_by_id(task.id)
+    assert first is not second and first.title == second.title
+    assert repository.cache_stats()["hits"] == 1
+    assert repository.cache_stats()["misses"] == 1
+
+
+def test_writes_invalidate_cache(repository):
+    """
+    Тест: save, save_many, delete и пакетные удаления сбрасывают кэш.
+    """
+    task = Task("купить хлеб")
+    repository.save(task)
+    repository.get_by_id(task.id)
+
+    task.mark_as_completed()
+    repository.save(task)
+    assert repository.get_by_id(task.id).status == Task.COMPLETED
+
+    task.title = "купить батон"
+    repository.save_many([task])
+    assert repository.get_by_id(task.id).title == "купить батон"
+
+    repository.delete_completed_tasks()
+    assert repository.get_by_id(task.id) is None
+
+    other = Task("позвонить")
+    repository.save(other)
+    repository.get_by_id(other.id)
+    repository.delete_all_tasks()
+    assert repository.get_by_id(other.id) is None
+
+
+def test_cache_disabled_by_default(tmp_path):
+    """
+    Тест: Без cache_size кэш выключен.
+    """
+    repository = TaskRepository(db_file=tmp_path / "tasks.db")
+    assert repository.cache is None and repository.cache_stats() == {}
@@ -0,0 +1,97 @@
+import threading
+
+import pytest
+
+from connection import Connect, ConnectionPool
+from solution import Task, TaskRepository
+
+
+@pytest.fixture
+def pool(tmp_path):
+    """Фикстура Pytest: пул соединений к временному файлу базы данных."""
+    with ConnectionPool(tmp_path / "tasks.db", size=2, timeout=0.5) as pool:
+        yield pool
+
+
+def test_pool_reuses_connection(pool):
+    """
+    Тест: Последовательные 'with' в одном потоке получают одно и то же соединение.
+    """
+    with Connect(pool.db_name, pool=pool) as cursor:
+        first = cursor.connection
+    with Connect(pool.db_name, pool=pool) as cursor:
+        second = cursor.connection
+    assert first is second
+
+
+def test_pool_nested_with_shares_transaction(pool):
+    """
+    Тест: Вложенный 'with' использует соединение внешнего, откат внешнего отменяет все.
+    """
+    with Connect(pool.db_name, pool=pool) as cursor:
+        cursor.execute("CREATE TABLE t (x INTEGER)")
+    with pytest.raises(RuntimeError):
+        with Connect(pool.db_name, pool=pool) as outer:
+            outer.execute("INSERT INTO t VALUES (1)")
+            with Connect(pool.db_name, pool=pool) as inner:
+                assert inner.connection is outer.connection
+                inner.execute("INSERT INTO t VALUES (2)")
+            raise RuntimeError("ошибка")
+    with Connect(pool.db_name, pool=pool) as cursor:
+        cursor.execute("SELECT COUNT(*) FROM t")
+        assert cursor.fetchone()[0] == 0
+
+
+def test_pool_per_thread_checkout_and_limit(pool):
+    """
+    Тест: Разные потоки получают разные соединения, сверх size - TimeoutError.
+    """
+    held = []
+    ready = threading.Event()
+    done = threading.Event()
+
+    def worker():
+        held.append(pool.acquire())
+        ready.set()
+        done.wait()
+        pool.release(held[0])
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    ready.wait()
+    conn = pool.acquire()
+    assert conn is not held[0]
+
+    errors = []
+    other = threading.Thread(target=lambda: errors.append(pytest.raises(TimeoutError, pool.acquire)))
+    other.start()
+    other.join()
+    assert errors
+
+    pool.release(conn)
+    done.set()
+    thread.join()
+
+
+def test_pool_replaces_broken_connection(pool):
+    """
+    Тест: Закрытое соединение не выдается повторно, вместо него создается новое.
+    """
+    conn = pool.acquire()
+    pool.release(conn)
+    conn.close()
+    fresh = pool.acquire()
+    assert fresh is not conn
+    fresh.execute("SELECT 1")
+    pool.release(fresh)
+
+
+def test_repository_with_pool(pool):
+    """
+    Тест: TaskRepository работает через внедренный пул.
+    """
+    repository = TaskRepository(pool=pool)
+    task = Task("купить хлеб", "зайти в магазин", priority=2)
+    repository.save(task)
+    assert task.id is not None
+    assert repository.get_by_id(task.id).title == "купить хлеб"
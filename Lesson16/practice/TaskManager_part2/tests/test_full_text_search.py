@@ -0,0 +1,61 @@
+import pytest
+
+from solution import Task, TaskRepository
+
+
+@pytest.fixture
+def repository(tmp_path):
+    """Фикстура Pytest: репозиторий с несколькими задачами."""
+    repository = TaskRepository(db_file=tmp_path / "tasks.db")
+    repository.save_many([
+        Task("молоко в холодильнике", "найти молоко"),
+        Task("купить хлеб", "зайти в ближайший магазин"),
+        Task("написать отчет", "молоко не покупать"),
+    ])
+    return repository
+
+
+def test_fts_index_created(repository):
+    """
+    Тест: При наличии FTS5 создается индекс tasks_fts.
+    """
+    assert repository.fts_enabled
+
+
+def test_search_prefix_and_rank(repository):
+    """
+    Тест: Поиск по началу слова, задача с совпадением в заголовке и описании выше.
+    """
+    titles = [task.title for task in repository.search("молок")]
+    assert titles == ["молоко в холодильнике", "написать отчет"]
+
+
+def test_search_follows_updates_and_deletes(repository):
+    """
+    Тест: Триггеры поддерживают индекс при изменении и удалении задач.
+    """
+    task = repository.search("хлеб")[0]
+    task.title = "купить батон"
+    repository.save(task)
+    assert repository.search("хлеб") == []
+    assert [t.id for t in repository.search("батон")] == [task.id]
+
+    repository.delete(task)
+    assert repository.search("батон") == []
+
+
+def test_title_contains_full_text_only_title(repository):
+    """
+    Тест: full_text=True ищет только в заголовке.
+    """
+    tasks = repository.get_tasks_by_title_contains("МОЛОК", full_text=True)
+    assert [task.title for task in tasks] == ["молоко в холодильнике"]
+
+
+def test_search_falls_back_to_like(repository):
+    """
+    Тест: Без FTS5 поиск работает через LIKE по заголовку и описанию.
+    """
+    repository.fts_enabled = False
+    assert len(repository.search("молоко")) == 2
+    assert len(repository.get_tasks_by_title_contains("хлеб", full_text=True)) == 1
@@ -0,0 +1,59 @@
+import pytest
+
+from solution import Task, TaskRepository
+
+
+@pytest.fixture
+def repository(tmp_path):
+    """Фикстура Pytest: репозиторий с 25 задачами разных статусов и приоритетов."""
+    repository = TaskRepository(db_file=tmp_path / "tasks.db")
+    statuses = (Task.PENDING, Task.IN_PROGRESS, Task.COMPLETED)
+    repository.save_many([
+        Task(f"задача {i}", status=statuses[i % 3], priority=i % 5 + 1) for i in range(25)
+    ])
+    return repository
+
+
+def _ids(tasks):
+    return [task.id for task in tasks]
+
+
+@pytest.mark.parametrize("page_size", [1, 4, 25, 100])
+def test_iter_all_tasks_matches_list(repository, page_size):
+    """
+    Тест: Постраничный обход возвращает те же задачи, что и get_all_tasks, при любом размере страницы.
+    """
+    assert _ids(repository.iter_all_tasks(page_size=page_size)) == _ids(repository.get_all_tasks())
+
+
+def test_iter_filters_match_lists(repository):
+    """
+    Тест: Потоковые фильтры совпадают со списочными.
+    """
+    assert _ids(repository.iter_tasks_by_status(Task.PENDING, page_size=3)) == \
+        _ids(repository.get_tasks_by_status(Task.PENDING))
+    assert _ids(repository.iter_completed_tasks(page_size=3)) == _ids(repository.get_completed_tasks())
+    assert _ids(repository.iter_tasks_by_priority(2, page_size=3)) == _ids(repository.get_tasks_by_priority(2))
+    assert _ids(repository.iter_tasks_by_priority_range(2, 3, page_size=3)) == \
+        sorted(_ids(repository.get_tasks_by_priority_range(2, 3)))
+
+
+def test_iter_is_lazy(repository):
+    """
+    Тест: Следующая страница читается только когда до нее дошли.
+    """
+    iterator = repository.iter_all_tasks(page_size=5)
+    first = next(iterator)
+    repository.delete_all_tasks()
+    assert first.title == "задача 0"
+    assert len(list(iterator)) == 4  # остаток уже прочитанной первой страницы
+
+
+def test_iter_validates_arguments_eagerly(repository):
+    """
+    Тест: Ошибки в аргументах видны сразу, а не при первом next().
+    """
+    with pytest.raises(ValueError):
+        repository.iter_all_tasks(page_size=0)
+    with pytest.raises(ValueError):
+        repository.iter_tasks_by_status("Done")
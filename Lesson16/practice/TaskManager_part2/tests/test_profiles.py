@@ -0,0 +1,50 @@
+import pytest
+
+from connection import PROFILES, Connect, ConnectionPool
+from solution import TaskRepository
+
+
+def _pragmas(cursor):
+    result = {}
+    for pragma in ("journal_mode", "synchronous", "cache_size", "temp_store"):
+        cursor.execute(f"PRAGMA {pragma}")
+        result[pragma] = cursor.fetchone()[0]
+    return result
+
+
+def test_connect_applies_profile(tmp_path):
+    """
+    Тест: Connect с профилем выполняет его PRAGMA на соединении.
+    """
+    with Connect(tmp_path / "tasks.db", profile="balanced") as cursor:
+        pragmas = _pragmas(cursor)
+    assert pragmas == {"journal_mode": "wal", "synchronous": 1, "cache_size": -16000, "temp_store": 2}
+
+
+def test_pool_applies_profile(tmp_path):
+    """
+    Тест: Пул применяет профиль к создаваемым соединениям.
+    """
+    with ConnectionPool(tmp_path / "tasks.db", size=1, profile="bulk-load") as pool:
+        with Connect(pool.db_name, pool=pool) as cursor:
+            pragmas = _pragmas(cursor)
+    assert pragmas["journal_mode"] == "memory" and pragmas["synchronous"] == 0
+
+
+def test_unknown_profile_rejected(tmp_path):
+    """
+    Тест: Неизвестный профиль - ValueError.
+    """
+    with pytest.raises(ValueError):
+        Connect(tmp_path / "tasks.db", profile="fast")
+    with pytest.raises(ValueError):
+        ConnectionPool(tmp_path / "tasks.db", profile="fast")
+
+
+@pytest.mark.parametrize("profile", list(PROFILES))
+def test_repository_with_profile(tmp_path, profile):
+    """
+    Тест: Репозиторий работает с любым профилем.
+    """
+    repository = TaskRepository(db_file=tmp_path / "tasks.db", profile=profile)
+    assert repository.get_all_tasks() == []
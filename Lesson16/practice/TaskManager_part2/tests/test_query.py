@@ -0,0 +1,78 @@
+import pytest
+
+from query import TaskQuery, compile_cache_info
+from solution import Task, TaskRepository
+
+
+@pytest.fixture
+def repository(tmp_path):
+    """Фикстура Pytest: репозиторий с 30 задачами разных статусов и приоритетов."""
+    repository = TaskRepository(db_file=tmp_path / "tasks.db")
+    statuses = (Task.PENDING, Task.IN_PROGRESS, Task.COMPLETED)
+    repository.save_many([
+        Task(f"{'отчет' if i % 4 == 0 else 'задача'} {i}", status=statuses[i % 3], priority=i % 5 + 1)
+        for i in range(30)
+    ])
+    return repository
+
+
+def test_compile_combined_filters():
+    """
+    Тест: Комбинация фильтров компилируется в один параметризованный запрос.
+    """
+    sql, params = (TaskQuery().where_status("Pending").priority_between(2, 4)
+                   .title_contains("отч").order_by_priority("desc").limit(5, offset=10).compile())
+    assert sql == ("SELECT * FROM tasks WHERE status = ? AND priority >= ? AND priority <= ? "
+                   "AND LOWER(title) LIKE LOWER(?) ORDER BY priority DESC, task_id DESC LIMIT ? OFFSET ?")
+    assert params == ("Pending", 2, 4, "%отч%", 5, 10)
+
+
+def test_compile_cached_by_shape():
+    """
+    Тест: Запросы одной формы с разными значениями используют один скомпилированный SQL.
+    """
+    TaskQuery().where_status("Pending").priority_between(1, 3).compile()
+    hits = compile_cache_info().hits
+    sql, params = TaskQuery().where_status("Completed").priority_between(2, 5).compile()
+    assert compile_cache_info().hits == hits + 1
+    assert params == ("Completed", 2, 5)
+
+
+def test_find_matches_python_filter(repository):
+    """
+    Тест: find возвращает то же, что фильтрация get_all_tasks в Python.
+    """
+    query = TaskQuery().where_status(Task.PENDING).priority_between(2, 5).title_contains("отчет")
+    expected = [t.id for t in repository.get_all_tasks()
+                if t.status == Task.PENDING and 2 <= t.priority <= 5 and "отчет" in t.title]
+    assert [t.id for t in repository.find(query)] == expected
+
+
+def test_find_keyset_by_priority(repository):
+    """
+    Тест: Keyset-пагинация по (priority, task_id) проходит все задачи без повторов.
+    """
+    query = TaskQuery().order_by_priority("DESC").limit(7)
+    seen = []
+    page = repository.find(query)
+    while page:
+        seen.extend(page)
+        last = page[-1]
+        page = repository.find(query.after(last.id, last.priority))
+    assert [t.id for t in seen] == [t.id for t in repository.get_all_tasks_sorted_by_priority("DESC")]
+
+
+def test_query_validation():
+    """
+    Тест: Проверки аргументов собраны в TaskQuery.
+    """
+    with pytest.raises(ValueError):
+        TaskQuery().where_status("Done")
+    with pytest.raises(TypeError):
+        TaskQuery().where_priority("3")
+    with pytest.raises(ValueError):
+        TaskQuery().priority_between(4, 2)
+    with pytest.raises(ValueError):
+        TaskQuery().order_by_priority("UP")
+    with pytest.raises(ValueError):
+        TaskQuery().order_by_priority().after(5)
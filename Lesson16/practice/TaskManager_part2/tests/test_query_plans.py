@@ -0,0 +1,45 @@
+import pytest
+
+from solution import Task, TaskRepository
+
+
+@pytest.fixture
+def repository(tmp_path):
+    """Фикстура Pytest: репозиторий на временном файле базы данных."""
+    return TaskRepository(db_file=tmp_path / "tasks.db")
+
+
+def test_filter_indexes_created(repository):
+    """
+    Тест: Схема содержит индексы по (status, priority) и (priority).
+    """
+    with repository._connect() as cursor:
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'tasks'")
+        indexes = {row[0] for row in cursor.fetchall()}
+    assert {"idx_tasks_status_priority", "idx_tasks_priority"} <= indexes
+
+
+@pytest.mark.parametrize("name", [
+    "get_tasks_by_status",
+    "get_tasks_by_priority",
+    "get_completed_tasks",
+    "get_tasks_by_priority_range",
+    "get_tasks_by_status_sorted_by_priority",
+])
+def test_filters_use_index(repository, name):
+    """
+    Тест: Фильтры по статусу и приоритету не читают таблицу целиком и не сортируют вручную.
+    """
+    info = repository.explain_queries()[name]
+    assert not info["full_scan"], info["plan"]
+    assert not info["temp_sort"], info["plan"]
+
+
+def test_get_tasks_by_status(repository):
+    """
+    Тест: get_tasks_by_status принимает допустимый статус и отвергает недопустимый.
+    """
+    repository.save_many([Task("a", status=Task.COMPLETED), Task("b")])
+    assert [task.title for task in repository.get_tasks_by_status(Task.COMPLETED)] == ["a"]
+    with pytest.raises(ValueError):
+        repository.get_tasks_by_status("Done")
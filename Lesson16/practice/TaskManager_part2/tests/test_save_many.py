@@ -0,0 +1,56 @@
+import pytest
+
+from solution import Task, TaskRepository
+
+
+@pytest.fixture
+def repository(tmp_path):
+    """Фикстура Pytest: репозиторий на временном файле базы данных."""
+    return TaskRepository(db_file=tmp_path / "tasks.db")
+
+
+def test_save_many_inserts_and_sets_ids(repository):
+    """
+    Тест: save_many вставляет новые задачи и проставляет им id из базы.
+    """
+    tasks = [Task(f"задача {i}", priority=i % 5 + 1) for i in range(25)]
+    assert repository.save_many(tasks, chunk_size=10) == 25
+
+    for task in tasks:
+        stored = repository.get_by_id(task.id)
+        assert stored is not None and stored.title == task.title
+    assert len({task.id for task in tasks}) == 25
+
+
+def test_save_many_updates_existing(repository):
+    """
+    Тест: Задачи с id обновляются, без id - вставляются, в одном вызове.
+    """
+    old = Task("старая")
+    repository.save(old)
+    old.mark_as_completed()
+    new = Task("новая")
+
+    repository.save_many([old, new])
+
+    assert repository.get_by_id(old.id).status == Task.COMPLETED
+    assert repository.get_by_id(new.id).title == "новая"
+    assert len(repository.get_all_tasks()) == 2
+
+
+def test_save_many_is_atomic(repository):
+    """
+    Тест: Ошибка в одной из задач откатывает всю пачку.
+    """
+    tasks = [Task("хорошая"), Task("плохая", priority=10)]
+    with pytest.raises(Exception):
+        repository.save_many(tasks)
+    assert repository.get_all_tasks() == []
+
+
+def test_save_many_invalid_chunk_size(repository):
+    """
+    Тест: chunk_size должен быть положительным.
+    """
+    with pytest.raises(ValueError):
+        repository.save_many([Task("x")], chunk_size=0)
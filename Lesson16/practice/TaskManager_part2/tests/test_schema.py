@@ -0,0 +1,63 @@
+import sqlite3
+
+import pytest
+
+import schema
+from connection import Connect
+from solution import Task, TaskRepository
+
+
+@pytest.fixture
+def db_file(tmp_path):
+    """Фикстура Pytest: путь к временному файлу базы, кэш схемы сбрасывается."""
+    path = tmp_path / "tasks.db"
+    yield path
+    schema.forget(path)
+
+
+def test_ensure_schema_sets_user_version(db_file):
+    """
+    Тест: После ensure_schema в PRAGMA user_version записана текущая версия.
+    """
+    assert schema.ensure_schema(db_file) == schema.SCHEMA_VERSION
+    with Connect(db_file) as cursor:
+        assert schema.get_version(cursor) == schema.SCHEMA_VERSION
+
+
+def test_ensure_schema_runs_once_per_file(db_file, monkeypatch):
+    """
+    Тест: Повторные вызовы ensure_schema не открывают соединение.
+    """
+    schema.ensure_schema(db_file)
+    calls = []
+    monkeypatch.setattr(schema, "migrate", lambda cursor: calls.append(cursor))
+    schema.ensure_schema(db_file)
+    TaskRepository(db_file=db_file).save(Task("без DDL"))
+    assert calls == []
+
+
+def test_migrate_upgrades_old_database(db_file):
+    """
+    Тест: База без версии (созданная старым кодом) доводится до текущей версии.
+    """
+    conn = sqlite3.connect(db_file)
+    conn.execute("CREATE TABLE tasks (task_id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL, "
+                 "description TEXT, status TEXT DEFAULT 'Pending', priority INTEGER DEFAULT 3)")
+    conn.execute("INSERT INTO tasks (title) VALUES ('старая задача')")
+    conn.commit()
+    conn.close()
+
+    repository = TaskRepository(db_file=db_file)
+    assert [task.title for task in repository.get_all_tasks()] == ["старая задача"]
+    with Connect(db_file) as cursor:
+        assert schema.get_version(cursor) == schema.SCHEMA_VERSION
+
+
+def test_migrate_rejects_newer_database(db_file):
+    """
+    Тест: База новее поддерживаемой версии не мигрируется.
+    """
+    with Connect(db_file) as cursor:
+        cursor.execute(f"PRAGMA user_version = {schema.SCHEMA_VERSION + 1}")
+    with pytest.raises(RuntimeError):
+        schema.ensure_schema(db_file)
@@ -0,0 +1,68 @@
+import pytest
+
+from solution import Task, TaskRepository
+
+
+@pytest.fixture
+def repository(tmp_path):
+    """Фикстура Pytest: репозиторий с задачами разных статусов и приоритетов."""
+    repository = TaskRepository(db_file=tmp_path / "tasks.db")
+    repository.save_many([
+        Task("a", status=Task.COMPLETED, priority=1),
+        Task("b", status=Task.COMPLETED, priority=1),
+        Task("c", status=Task.PENDING, priority=5),
+        Task("d", status=Task.IN_PROGRESS, priority=3),
+    ])
+    return repository
+
+
+def _stats_from_tasks(repository):
+    """Та же статистика, посчитанная в Python по get_all_tasks - для сравнения."""
+    histogram = {}
+    for task in repository.get_all_tasks():
+        key = (task.status, task.priority)
+        histogram[key] = histogram.get(key, 0) + 1
+    return histogram
+
+
+def test_stats(repository):
+    """
+    Тест: stats() возвращает счетчики по статусам, приоритетам и долю завершенных.
+    """
+    stats = repository.stats()
+    assert stats["total"] == 4
+    assert stats["by_status"] == {"Pending": 1, "In Progress": 1, "Completed": 2}
+    assert stats["by_priority"] == {1: 2, 2: 0, 3: 1, 4: 0, 5: 1}
+    assert stats["by_status_priority"] == {("Completed", 1): 2, ("Pending", 5): 1, ("In Progress", 3): 1}
+    assert stats["completion_ratio"] == 0.5
+    assert repository.count_by_status() == stats["by_status"]
+    assert repository.count_by_priority() == stats["by_priority"]
+    assert repository.completion_ratio() == 0.5
+
+
+def test_summary_follows_changes(repository):
+    """
+    Тест: Триггеры поддерживают сводку при изменении, удалении и пакетном удалении.
+    """
+    task = repository.get_tasks_by_status(Task.PENDING)[0]
+    task.mark_as_completed()
+    task.set_priority(2)
+    repository.save(task)
+    assert repository.status_priority_histogram() == _stats_from_tasks(repository)
+
+    repository.delete(repository.get_tasks_by_status(Task.IN_PROGRESS)[0])
+    assert repository.status_priority_histogram() == _stats_from_tasks(repository)
+
+    repository.delete_completed_tasks()
+    assert repository.stats()["total"] == 0
+    assert repository.completion_ratio() == 0.0
+
+
+def test_rebuild_stats(repository):
+    """
+    Тест: rebuild_stats восстанавливает испорченную сводку.
+    """
+    with repository._connect() as cursor:
+        cursor.execute("UPDATE tasks_summary SET count = 100")
+    repository.rebuild_stats()
+    assert repository.status_priority_histogram() == _stats_from_tasks(repository)
@@ -0,0 +1,34 @@
+import pytest
+
+from solution import Task, TaskRepository
+
+
+def test_task_uses_slots():
+    """
+    Тест: У Task нет __dict__, лишние атрибуты не создаются.
+    """
+    task = Task("купить хлеб")
+    assert not hasattr(task, "__dict__")
+    with pytest.raises(AttributeError):
+        task.colour = "red"
+
+
+def test_task_from_row():
+    """
+    Тест: from_row раскладывает строку таблицы tasks по атрибутам.
+    """
+    task = Task.from_row((7, "купить хлеб", "в магазине", Task.IN_PROGRESS, 2))
+    assert (task.id, task.title, task.description, task.status, task.priority) == \
+        (7, "купить хлеб", "в магазине", Task.IN_PROGRESS, 2)
+
+
+def test_repository_returns_tasks(tmp_path):
+    """
+    Тест: Методы репозитория возвращают объекты Task, построенные row_factory.
+    """
+    repository = TaskRepository(db_file=tmp_path / "tasks.db")
+    task = Task("купить хлеб", priority=4)
+    repository.save(task)
+    stored = repository.get_by_id(task.id)
+    assert isinstance(stored, Task) and stored.priority == 4
+    assert all(isinstance(t, Task) for t in repository.get_all_tasks())
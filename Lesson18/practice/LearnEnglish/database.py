@@ -3,6 +3,9 @@ import sqlite3
 from pathlib import Path
 from helpers.connection import Connect
 
+# Профиль настроек SQLite (см. helpers.connection.PROFILES) для базы словаря
+DB_PROFILE = "balanced"
+
 
 def init_db(cursor: sqlite3.Cursor):
     """Инициализирует базу данных, создает таблицу words, если ее нет."""
@@ -1,21 +1,178 @@
+from collections import Counter, OrderedDict
 from pathlib import Path
+from typing import Optional
 import sqlite3
 
 
+# Профили настроек SQLite. Применяются к каждому новому соединению.
+# durable   - максимальная сохранность: WAL + полная синхронизация на каждый commit;
+# balanced  - WAL + synchronous=NORMAL (после сбоя питания может потеряться
+#             последняя транзакция, но база не повреждается), больший кэш и mmap;
+# bulk-load - массовая загрузка: журнал в памяти и без синхронизации,
+#             при сбое во время загрузки база может быть повреждена.
+PROFILES = {
+    "durable": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "cache_size": -2000,  # отрицательное значение - размер в КиБ
+        "mmap_size": 0,
+        "temp_store": "DEFAULT",
+    },
+    "balanced": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -16000,
+        "mmap_size": 128 * 1024 * 1024,
+        "temp_store": "MEMORY",
+    },
+    "bulk-load": {
+        "journal_mode": "MEMORY",
+        "synchronous": "OFF",
+        "cache_size": -64000,
+        "mmap_size": 256 * 1024 * 1024,
+        "temp_store": "MEMORY",
+    },
+}
+
+
+def apply_profile(conn: sqlite3.Connection, profile: str) -> None:
+    """Выполняет PRAGMA профиля profile на соединении conn."""
+    if profile not in PROFILES:
+        raise ValueError(f"Неизвестный профиль '{profile}', допустимые: {', '.join(PROFILES)}")
+    for pragma, value in PROFILES[profile].items():
+        conn.execute(f"PRAGMA {pragma} = {value}")
+
+
+# Размер кэша подготовленных выражений на соединение (как у sqlite3.connect по умолчанию)
+DEFAULT_CACHED_STATEMENTS = 128
+
+class StatementStats:
+    """
+    Счетчики использования подготовленных выражений по тексту SQL.
+    Промах - выражение разбирается заново (его нет в кэше соединения),
+    попадание - sqlite3 берет уже подготовленное выражение из кэша.
+    """
+
+    def __init__(self):
+        self.hits: Counter = Counter()
+        self.misses: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, sql: str, hit: bool) -> None:
+        with self._lock:
+            (self.hits if hit else self.misses)[sql] += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self.hits.clear()
+            self.misses.clear()
+
+    def summary(self, registry: Optional["StatementRegistry"] = None) -> dict:
+        """
+        Счетчики {имя или SQL: {"hits": ..., "misses": ...}}.
+        Если передан registry - только его именованные выражения.
+        """
+        with self._lock:
+            if registry is not None:
+                return {name: {"hits": self.hits[sql], "misses": self.misses[sql]}
+                        for name, sql in registry.items()}
+            return {sql: {"hits": self.hits[sql], "misses": self.misses[sql]}
+                    for sql in self.hits.keys() | self.misses.keys()}
+
+
+STATEMENT_STATS = StatementStats()
+
+
+class StatementRegistry:
+    """Реестр именованных SQL-выражений приложения: один текст на запрос - одна запись в кэше."""
+
+    def __init__(self, statements: dict[str, str]):
+        self._statements = dict(statements)
+
+    def __getitem__(self, name: str) -> str:
+        return self._statements[name]
+
+    def items(self):
+        return self._statements.items()
+
+    def stats(self) -> dict:
+        """Попадания/промахи кэша выражений для каждого имени."""
+        return STATEMENT_STATS.summary(self)
+
+
+class TrackedCursor(sqlite3.Cursor):
+    """Курсор, сообщающий соединению о каждом выполняемом выражении."""
+
+    def execute(self, sql, parameters=()):
+        self.connection._track_statement(sql)
+        return super().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        self.connection._track_statement(sql)
+        return super().executemany(sql, seq_of_parameters)
+
+
+class TrackedConnection(sqlite3.Connection):
+    """
+    Соединение, которое ведет копию LRU-кэша выражений sqlite3
+    (тот же размер cached_statements, тот же ключ - текст SQL)
+    и по ней считает попадания и промахи в STATEMENT_STATS.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cached_statements = kwargs.get("cached_statements", DEFAULT_CACHED_STATEMENTS)
+        self._statements: OrderedDict = OrderedDict()
+
+    def _track_statement(self, sql: str) -> None:
+        hit = sql in self._statements
+        if hit:
+            self._statements.move_to_end(sql)
+        elif self.cached_statements > 0:
+            self._statements[sql] = None
+            if len(self._statements) > self.cached_statements:
+                self._statements.popitem(last=False)
+        STATEMENT_STATS.record(sql, hit)
+
+    def cursor(self, factory=None):
+        return super().cursor(factory or TrackedCursor)
+
+    # Connection.execute создает курсор в обход переопределенного cursor().execute
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+
+def open_connection(db_name: Path, cached_statements: Optional[int] = None, **kwargs) -> TrackedConnection:
+    """Открывает TrackedConnection с кэшем на cached_statements подготовленных выражений."""
+    if cached_statements is None:
+        cached_statements = DEFAULT_CACHED_STATEMENTS
+    return sqlite3.connect(db_name, factory=TrackedConnection, cached_statements=cached_statements, **kwargs)
+
+
 class Connect:
     """
     Класс для подключения к базе данных SQLite,
     поддерживающий использование с оператором 'with'.
     """
 
-    def __init__(self, db_name: Path):
+    def __init__(self, db_name: Path, profile: Optional[str] = None,
+                 cached_statements: int = DEFAULT_CACHED_STATEMENTS):
         """
         Инициализирует объект Connect.
 
         Args:
             db_name: Имя файла базы данных SQLite.
+            profile: Имя профиля из PROFILES ("durable", "balanced", "bulk-load").
+            cached_statements: Размер кэша подготовленных выражений соединения.
         """
+        if profile is not None and profile not in PROFILES:
+            raise ValueError(f"Неизвестный профиль '{profile}', допустимые: {', '.join(PROFILES)}")
         self.db_name = db_name
+        self.profile = profile
+        self.cached_statements = cached_statements
         self.conn = None
         self.cursor = None
 
@@ -28,7 +185,9 @@ class Connect:
             sqlite3.Cursor: Объект курсора для выполнения SQL-запросов.
         """
         try:
-            self.conn = sqlite3.connect(self.db_name)
+            self.conn = open_connection(self.db_name, self.cached_statements)
+            if self.profile is not None:
+                apply_profile(self.conn, self.profile)
             self.cursor = self.conn.cursor()
             return self.cursor
         except sqlite3.Error as e:
@@ -65,6 +65,6 @@ def main_menu(cursor):
 
 
 if __name__ == "__main__":
-    with Connect(PATH_TO_DB) as cursor:
+    with Connect(PATH_TO_DB, profile=database.DB_PROFILE) as cursor:
         database.init_db(cursor)
         main_menu(cursor)